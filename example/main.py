@@ -12,30 +12,105 @@
 #   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
-import json
-from random import randint
+from dataclasses import dataclass
+from random import Random
+from time import monotonic
 from time import sleep
-from time import time
+from time import time_ns
+from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import List
 from typing import Tuple
 from typing import Union
 
 import wolk_gateway_module as wolk
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 # # uncomment to enable debug logging to file
 wolk.logging_config("debug", "wolk_gateway_module.log")
 
-with open("configuration.json", encoding="utf-8") as file:
-    configuration = json.load(file)
 
+def load_configuration(
+    file_path: str = "configuration.json",
+) -> Dict[str, Any]:
+    """
+    Load module configuration from file.
+
+    :param file_path: Path to configuration file
+    :type file_path: str
+    :returns: configuration
+    :rtype: Dict[str, Any]
+    """
+    with open(file_path, "rb") as file:
+        return json_loads(file.read())
+
+
+configuration = load_configuration()
+
+
+@dataclass
+class State:
+    """Current actuator and configuration values of example devices."""
+
+    switch: bool = False
+    slider: int = 0
+    text: str = "default_text"
+    device_1_configuration_1: str = "default_value"
+    device_1_configuration_2: Tuple[int, int, int] = (5, 12, 3)
+    device_2_configuration_1: float = 8.13
+
+
+state = State()
 
-switch = False
-slider = 0
-text = "default_text"
 
-device_1_configuration_1 = "default_value"
-device_1_configuration_2 = (5, 12, 3)
-device_2_configuration_1 = 8.13
+def _make_setter(attribute: str) -> Callable[[Any], None]:
+    def setter(value: Any) -> None:
+        setattr(state, attribute, value)
+
+    return setter
+
+
+def _make_getter(attribute: str) -> Callable[[], Any]:
+    def getter() -> Any:
+        return getattr(state, attribute)
+
+    return getter
+
+
+_ACTUATION_SETTERS = {
+    "module_device_1": {
+        "SW": _make_setter("switch"),
+        "MSG": _make_setter("text"),
+    },
+    "module_device_2": {"SL": _make_setter("slider")},
+}
+
+_ACTUATOR_GETTERS = {
+    "module_device_1": {
+        "SW": _make_getter("switch"),
+        "MSG": _make_getter("text"),
+    },
+    "module_device_2": {"SL": _make_getter("slider")},
+}
+
+_CONFIGURATION_SETTERS = {
+    "module_device_1": {
+        "configuration_1": _make_setter("device_1_configuration_1"),
+        "configuration_2": _make_setter("device_1_configuration_2"),
+    },
+    "module_device_2": {
+        "configuration_1": _make_setter("device_2_configuration_1"),
+    },
+}
+_ALLOWED_CONFIGURATIONS = {
+    device_key: frozenset(setters)
+    for device_key, setters in _CONFIGURATION_SETTERS.items()
+}
 
 temperature_sensor = wolk.SensorTemplate(
     name="Temperature",
@@ -142,7 +217,13 @@ device_template_2 = wolk.DeviceTemplate(
 device2 = wolk.Device("Device2", "module_device_2", device_template_2)
 
 
-device_1_firmware_version = 1
+# Current firmware version of devices that support firmware update
+_FIRMWARE_VERSIONS = {"module_device_1": 1}
+
+_DEVICE_STATUSES = {
+    "module_device_1": wolk.DeviceStatus.CONNECTED,
+    "module_device_2": wolk.DeviceStatus.CONNECTED,
+}
 
 
 class FirmwareHandlerImplementation(wolk.FirmwareHandler):
@@ -178,24 +259,18 @@ class FirmwareHandlerImplementation(wolk.FirmwareHandler):
         :param firmware_file_path: Path where the firmware file is located
         :type firmware_file_path: str
         """
-        if device_key == "module_device_1":
-            print(
-                f"Installing firmware: '{firmware_file_path}' "
-                f"on device '{device_key}'"
-            )
+        if device_key not in _FIRMWARE_VERSIONS:
+            return
+
+        print(
+            f"Installing firmware: '{firmware_file_path}' "
+            f"on device '{device_key}'"
+        )
 
-            # Handle the actual installation here
+        # Handle the actual installation here
 
-            if True:
-                global device_1_firmware_version
-                device_1_firmware_version += 1
-                self.on_install_success(device_key)
-            else:
-                status = wolk.FirmwareUpdateStatus(
-                    wolk.FirmwareUpdateState.ERROR,
-                    wolk.FirmwareUpdateErrorCode.INSTALLATION_FAILED,
-                )
-                self.on_install_fail(device_key, status)
+        _FIRMWARE_VERSIONS[device_key] += 1
+        self.on_install_success(device_key)
 
     def abort_installation(self, device_key: str) -> None:
         """
@@ -209,12 +284,12 @@ class FirmwareHandlerImplementation(wolk.FirmwareHandler):
         :param device_key: Device for which to abort installation
         :type device_key: str
         """
-        if device_key == "module_device_1":
-            # manage to stop firmware installation
-            status = wolk.FirmwareUpdateStatus(
-                wolk.FirmwareUpdateState.ABORTED
-            )
-            self.on_install_fail(device_key, status)
+        if device_key not in _FIRMWARE_VERSIONS:
+            return
+
+        # manage to stop firmware installation
+        status = wolk.FirmwareUpdateStatus(wolk.FirmwareUpdateState.ABORTED)
+        self.on_install_fail(device_key, status)
 
     def get_firmware_version(self, device_key: str) -> str:
         """
@@ -225,16 +300,14 @@ class FirmwareHandlerImplementation(wolk.FirmwareHandler):
         :returns: version
         :rtype: str
         """
-        if device_key == "module_device_1":
-            return str(device_1_firmware_version)
+        version = _FIRMWARE_VERSIONS.get(device_key)
+        if version is not None:
+            return str(version)
 
 
 def get_device_status(device_key: str) -> wolk.DeviceStatus:
     """Return current device status."""
-    if device_key == "module_device_1":
-        return wolk.DeviceStatus.CONNECTED
-    elif device_key == "module_device_2":
-        return wolk.DeviceStatus.CONNECTED
+    return _DEVICE_STATUSES.get(device_key)
 
 
 def handle_actuation(
@@ -253,20 +326,10 @@ def handle_actuation(
     :param value: Value to which to set the actuator
     :type value: Union[bool, int, float, str]
     """
-    if device_key == "module_device_1":
-        if reference == "SW":
-            # Handle setting the actuator value here
-            global switch
-            switch = value
-
-        elif reference == "MSG":
-            global text
-            text = value
-
-    elif device_key == "module_device_2":
-        if reference == "SL":
-            global slider
-            slider = value
+    # Handle setting the actuator value here
+    setter = _ACTUATION_SETTERS.get(device_key, {}).get(reference)
+    if setter is not None:
+        setter(value)
 
 
 def get_actuator_status(
@@ -288,19 +351,9 @@ def get_actuator_status(
     :returns: (state, value)
     :rtype: (ActuatorState, bool or int or float or str)
     """
-    if device_key == "module_device_1":
-        if reference == "SW":
-            global switch
-            return wolk.ActuatorState.READY, switch
-
-        elif reference == "MSG":
-            global text
-            return wolk.ActuatorState.READY, text
-
-    elif device_key == "module_device_2":
-        if reference == "SL":
-            global slider
-            return wolk.ActuatorState.READY, slider
+    getter = _ACTUATOR_GETTERS.get(device_key, {}).get(reference)
+    if getter is not None:
+        return wolk.ActuatorState.READY, getter()
 
 
 def get_configuration(
@@ -335,16 +388,13 @@ def get_configuration(
     :rtype: dict
     """
     if device_key == "module_device_1":
-        global device_1_configuration_1
-        global device_1_configuration_2
         return {
-            "configuration_1": device_1_configuration_1,
-            "configuration_2": device_1_configuration_2,
+            "configuration_1": state.device_1_configuration_1,
+            "configuration_2": state.device_1_configuration_2,
         }
 
     elif device_key == "module_device_2":
-        global device_2_configuration_1
-        return {"configuration_1": device_2_configuration_1}
+        return {"configuration_1": state.device_2_configuration_1}
 
 
 def handle_configuration(
@@ -376,23 +426,11 @@ def handle_configuration(
     :param configuration: Configuration option reference:value pairs
     :type configuration: dict
     """
-    if device_key == "module_device_1":
-        # Handle setting configuration values here
-        global device_1_configuration_1
-        global device_1_configuration_2
-
-        for reference, value in configuration.items():
-            if reference == "configuration_1":
-                device_1_configuration_1 = value
-            elif reference == "configuration_2":
-                device_1_configuration_2 = value
-
-    elif device_key == "module_device_2":
-        global device_2_configuration_1
-
-        for reference, value in configuration.items():
-            if reference == "configuration_1":
-                device_2_configuration_1 = value
+    # Handle setting configuration values here
+    setters = _CONFIGURATION_SETTERS.get(device_key, {})
+    allowed = _ALLOWED_CONFIGURATIONS.get(device_key, frozenset())
+    for reference in allowed & configuration.keys():
+        setters[reference](configuration[reference])
 
 
 wolk_module = wolk.Wolk(
@@ -411,26 +449,46 @@ wolk_module = wolk.Wolk(
 wolk_module.add_device(device1)
 wolk_module.add_device(device2)
 
+# Connecting publishes device status, actuator statuses, configuration
+# and firmware version of every added device. After that actuator status is
+# published by the module only when an actuation command is handled,
+# so there is no need to republish unchanged values here.
 wolk_module.connect()
 
 wolk_module.publish()
 
-wolk_module.publish_configuration("module_device_1")
-wolk_module.publish_configuration("module_device_2")
-
-wolk_module.publish_actuator_status("module_device_1", "SW")
-wolk_module.publish_actuator_status("module_device_1", "MSG")
-wolk_module.publish_actuator_status("module_device_2", "SL")
-
-wolk_module.publish_device_status("module_device_1")
-wolk_module.publish_device_status("module_device_2")
+# Sample the temperature sensor every SAMPLE_PERIOD seconds against a
+# monotonic deadline so the period does not drift with publish time,
+# and only store a reading when its value has changed.
+# Stored readings are published together once every PUBLISH_EVERY samples.
+# Temperatures are drawn SAMPLE_BLOCK at a time rather than one per sample.
+SAMPLE_PERIOD = 0.3
+PUBLISH_EVERY = 10
+last_temperature = None
+samples = 0
+next_sample = monotonic()
+random_temperatures = Random().choices
+TEMPERATURE_RANGE = range(-20, 86)
+SAMPLE_BLOCK = 1000
+temperatures: List[int] = []
 
 while True:
     try:
-        sleep(3)
-        wolk_module.add_sensor_reading(
-            "module_device_1", "T", randint(-20, 85), int(round(time() * 1000))
-        )
-        wolk_module.publish()
+        next_sample += SAMPLE_PERIOD
+        sleep(max(0.0, next_sample - monotonic()))
+        if not temperatures:
+            temperatures = random_temperatures(
+                TEMPERATURE_RANGE, k=SAMPLE_BLOCK
+            )
+        temperature = temperatures.pop()
+        if temperature != last_temperature:
+            wolk_module.add_sensor_reading(
+                "module_device_1", "T", temperature, time_ns() // 1_000_000
+            )
+            last_temperature = temperature
+        samples += 1
+        if samples == PUBLISH_EVERY:
+            wolk_module.publish()
+            samples = 0
     except KeyboardInterrupt:
         break
@@ -26,6 +26,7 @@ setuptools.setup(
     name="wolk-gateway-module",
     version=__version__,
     install_requires=["paho_mqtt>=1.4.0"],
+    extras_require={"orjson": ["orjson>=3"]},
     include_package_data=True,
     license="Apache License 2.0",
     author="WolkAbout",
@@ -12,12 +12,8 @@
 #   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
-import json
-import sys
 import unittest
 
-sys.path.append("..")  # noqa
-
 from wolk_gateway_module.json_data_protocol import JsonDataProtocol
 from wolk_gateway_module.model.actuator_command import (
     ActuatorCommand,
@@ -184,6 +180,38 @@ class JsonDataProtocolTests(unittest.TestCase):
 
         self.assertEqual(expected, deserialized)
 
+    def test_make_configuration_set_message_keeps_text_values(self):
+        """Test deserializing of text and empty configuration values."""
+        json_data_protocol = JsonDataProtocol()
+
+        message = Message(
+            self.CONFIGURATION_SET + self.DEVICE_PATH_PREFIX + "some_key",
+            '{"config_1": "a,b", "config_2": "text", "config_3": 5}',
+        )
+
+        expected = ConfigurationCommand(
+            ConfigurationCommandType.SET,
+            {"config_1": ("a", "b"), "config_2": "text", "config_3": 5},
+        )
+
+        deserialized = json_data_protocol.make_configuration_command(message)
+
+        self.assertEqual(expected, deserialized)
+
+    def test_make_configuration_set_message_without_values(self):
+        """Test deserializing of configuration_set message with no values."""
+        json_data_protocol = JsonDataProtocol()
+
+        message = Message(
+            self.CONFIGURATION_SET + self.DEVICE_PATH_PREFIX + "some_key", "{}"
+        )
+
+        expected = ConfigurationCommand(ConfigurationCommandType.SET, {})
+
+        deserialized = json_data_protocol.make_configuration_command(message)
+
+        self.assertEqual(expected, deserialized)
+
     def test_make_configuration_get_message(self):
         """Test deserializing of configuration_get message."""
         json_data_protocol = JsonDataProtocol()
@@ -211,7 +239,7 @@ class JsonDataProtocolTests(unittest.TestCase):
             + self.CHANNEL_DELIMITER
             + self.REFERENCE_PATH_PREFIX
             + "REF",
-            '{"data": "value"}',
+            '{"data":"value"}',
         )
 
         serialized = json_data_protocol.make_sensor_reading_message(
@@ -233,7 +261,7 @@ class JsonDataProtocolTests(unittest.TestCase):
             + self.CHANNEL_DELIMITER
             + self.REFERENCE_PATH_PREFIX
             + "REF",
-            '{"data": "1,2,3"}',
+            '{"data":"1,2,3"}',
         )
 
         serialized = json_data_protocol.make_sensor_reading_message(
@@ -242,6 +270,20 @@ class JsonDataProtocolTests(unittest.TestCase):
 
         self.assertEqual(expected, serialized)
 
+    def test_make_sensor_readings_message_keeps_readings(self):
+        """Test serializing multiple readings leaves their values intact."""
+        json_data_protocol = JsonDataProtocol()
+
+        readings = [SensorReading("ACL", (1, 2, 3)), SensorReading("B", True)]
+
+        serialized = json_data_protocol.make_sensor_readings_message(
+            "some_key", readings
+        )
+
+        self.assertEqual('{"ACL":"1,2,3","B":"true"}', serialized.payload)
+        self.assertEqual((1, 2, 3), readings[0].value)
+        self.assertIs(True, readings[1].value)
+
     def test_make_alarm_message(self):
         """Test serializing of alarm event for device key."""
         json_data_protocol = JsonDataProtocol()
@@ -255,7 +297,7 @@ class JsonDataProtocolTests(unittest.TestCase):
             + self.CHANNEL_DELIMITER
             + self.REFERENCE_PATH_PREFIX
             + "REF",
-            '{"data": "true", "utc": 1557150524022}',
+            '{"data":"true","utc":1557150524022}',
         )
 
         serialized = json_data_protocol.make_alarm_message("some_key", reading)
@@ -277,7 +319,7 @@ class JsonDataProtocolTests(unittest.TestCase):
             + self.CHANNEL_DELIMITER
             + self.REFERENCE_PATH_PREFIX
             + reference,
-            json.dumps({"status": "READY", "value": "15"}),
+            '{"status":"READY","value":"15"}',
         )
 
         serialized = json_data_protocol.make_actuator_status_message(
@@ -300,8 +342,7 @@ class JsonDataProtocolTests(unittest.TestCase):
 
         expected = Message(
             self.CONFIGURATION_STATUS + self.DEVICE_PATH_PREFIX + device_key,
-            '{"values": {"ref1": "false", "ref2": "2",'
-            + ' "ref3": "4.4", "ref4": "a,b"}}',
+            '{"values":{"ref1":"false","ref2":"2","ref3":"4.4","ref4":"a,b"}}',
         )
 
         serialized = json_data_protocol.make_configuration_message(
@@ -310,6 +351,27 @@ class JsonDataProtocolTests(unittest.TestCase):
 
         self.assertEqual(expected, serialized)
 
+    def test_make_status_messages_keep_inputs(self):
+        """Test serializing actuator status and configuration keeps inputs."""
+        json_data_protocol = JsonDataProtocol()
+
+        actuator_status = ActuatorStatus("REF", ActuatorState.READY, True)
+        configuration = {"ref1": False, "ref2": ("a", "b")}
+
+        status = json_data_protocol.make_actuator_status_message(
+            "some_key", actuator_status
+        )
+        values = json_data_protocol.make_configuration_message(
+            "some_key", configuration
+        )
+
+        self.assertEqual('{"status":"READY","value":"true"}', status.payload)
+        self.assertEqual(
+            '{"values":{"ref1":"false","ref2":"a,b"}}', values.payload
+        )
+        self.assertIs(True, actuator_status.value)
+        self.assertEqual({"ref1": False, "ref2": ("a", "b")}, configuration)
+
 
 if __name__ == "__main__":
     unittest.main()
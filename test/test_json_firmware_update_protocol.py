@@ -13,11 +13,8 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 import json
-import sys
 import unittest
 
-sys.path.append("..")  # noqa
-
 
 from wolk_gateway_module.json_firmware_update_protocol import (
     JsonFirmwareUpdateProtocol,
@@ -70,7 +67,7 @@ class JsonFirmwareUpdateProtocolTests(unittest.TestCase):
             self.FIRMWARE_UPDATE_STATUS_TOPIC_ROOT
             + self.DEVICE_PATH_PREFIX
             + device_key,
-            json.dumps({"status": "INSTALLATION"}),
+            '{"status":"INSTALLATION"}',
         )
 
         self.assertEqual(
@@ -93,12 +90,7 @@ class JsonFirmwareUpdateProtocolTests(unittest.TestCase):
             self.FIRMWARE_UPDATE_STATUS_TOPIC_ROOT
             + self.DEVICE_PATH_PREFIX
             + device_key,
-            json.dumps(
-                {
-                    "status": status.status.value,
-                    "error": status.error_code.value,
-                }
-            ),
+            '{"status":"INSTALLATION","error":2}',
         )
 
         self.assertEqual(
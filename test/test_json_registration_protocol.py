@@ -13,11 +13,8 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 import json
-import sys
 import unittest
 
-sys.path.append("..")  # noqa
-
 from wolk_gateway_module.json_registration_protocol import (
     JsonRegistrationProtocol,
 )
@@ -57,13 +54,17 @@ class JsonRegistrationProtocolTests(unittest.TestCase):
         "p2d/register_subdevice_response/"
     )
 
+    @classmethod
+    def setUpClass(cls):
+        """Create the protocol shared by all tests."""
+        cls.json_registration_protocol = JsonRegistrationProtocol()
+
     def test_get_inbound_topics_for_device(self):
         """Test that returned list is correct for given device key."""
-        json_registration_protocol = JsonRegistrationProtocol()
         device_key = "some_key"
 
         self.assertEqual(
-            json_registration_protocol.get_inbound_topics_for_device(
+            self.json_registration_protocol.get_inbound_topics_for_device(
                 device_key
             ),
             [
@@ -75,7 +76,6 @@ class JsonRegistrationProtocolTests(unittest.TestCase):
 
     def test_extract_key_from_message(self):
         """Test that device key is extracted."""
-        json_registration_protocol = JsonRegistrationProtocol()
         device_key = "some_device_key"
 
         message = Message(
@@ -85,26 +85,22 @@ class JsonRegistrationProtocolTests(unittest.TestCase):
         )
 
         self.assertEqual(
-            json_registration_protocol.extract_key_from_message(message),
+            self.json_registration_protocol.extract_key_from_message(message),
             device_key,
         )
 
     def test_is_registration_response_message(self):
         """Test that message is device registration response."""
-        json_registration_protocol = JsonRegistrationProtocol()
-
         message = Message(self.DEVICE_REGISTRATION_RESPONSE_TOPIC_ROOT)
 
         self.assertTrue(
-            json_registration_protocol.is_registration_response_message(
+            self.json_registration_protocol.is_registration_response_message(
                 message
             )
         )
 
     def test_empty_device_registration_request(self):
         """Test registration request for empty device template."""
-        json_registration_protocol = JsonRegistrationProtocol()
-
         device_template = DeviceTemplate()
         device_name = "device_name"
         device_key = "device_key"
@@ -113,32 +109,29 @@ class JsonRegistrationProtocolTests(unittest.TestCase):
             device_name, device_key, device_template
         )
 
-        expected_payload = json.loads(
-            "{"
-            + '"name": "device_name",'
-            + '"deviceKey": "device_key",'
-            + '"defaultBinding": true,'
-            + '"sensors": [],'
-            + '"actuators": [],'
-            + '"alarms": [],'
-            + '"configurations": [],'
-            + '"typeParameters": {},'
-            + '"connectivityParameters": {},'
-            + '"firmwareUpdateParameters": {"supportsFirmwareUpdate": false},'
-            + '"firmwareUpdateType": ""'
-            + "}"
-        )
-
-        message = json_registration_protocol.make_registration_message(
+        expected_payload = {
+            "name": "device_name",
+            "deviceKey": "device_key",
+            "defaultBinding": True,
+            "typeParameters": {},
+            "connectivityParameters": {},
+            "firmwareUpdateType": "",
+            "sensors": [],
+            "actuators": [],
+            "alarms": [],
+            "configurations": [],
+            "firmwareUpdateParameters": {"supportsFirmwareUpdate": False},
+        }
+
+        message = self.json_registration_protocol.make_registration_message(
             device_registration_request
         )
 
+        self.assertIsInstance(message.payload, bytes)
         self.assertEqual(expected_payload, json.loads(message.payload))
 
     def test_simple_device_registration_request(self):
         """Test registration request for simple device template."""
-        json_registration_protocol = JsonRegistrationProtocol()
-
         device_name = "simple_device"
         device_key = "simple_key"
         temperature_sensor = SensorTemplate(
@@ -157,36 +150,36 @@ class JsonRegistrationProtocolTests(unittest.TestCase):
             device_name, device_key, device_template
         )
 
-        expected_payload = json.loads(
-            "{"
-            + '"name": "simple_device",'
-            + '"deviceKey": "simple_key",'
-            + '"defaultBinding": true,'
-            + '"sensors": ['
-            + '{"name": "Temperature", '
-            + '"reference": "T", '
-            + '"unit": {"readingTypeName": "TEMPERATURE", "symbol": "℃"}, '
-            + '"description": "A temperature sensor"}],'
-            + '"actuators": [],'
-            + '"alarms": [],'
-            + '"configurations": [],'
-            + '"typeParameters": {},'
-            + '"connectivityParameters": {},'
-            + '"firmwareUpdateParameters": {"supportsFirmwareUpdate": false},'
-            + '"firmwareUpdateType": ""'
-            + "}"
-        )
-
-        message = json_registration_protocol.make_registration_message(
+        expected_payload = {
+            "name": "simple_device",
+            "deviceKey": "simple_key",
+            "defaultBinding": True,
+            "typeParameters": {},
+            "connectivityParameters": {},
+            "firmwareUpdateType": "",
+            "sensors": [
+                {
+                    "name": "Temperature",
+                    "reference": "T",
+                    "description": "A temperature sensor",
+                    "unit": {"readingTypeName": "TEMPERATURE", "symbol": "℃"},
+                }
+            ],
+            "actuators": [],
+            "alarms": [],
+            "configurations": [],
+            "firmwareUpdateParameters": {"supportsFirmwareUpdate": False},
+        }
+
+        message = self.json_registration_protocol.make_registration_message(
             device_registration_request
         )
 
+        self.assertIsInstance(message.payload, bytes)
         self.assertEqual(expected_payload, json.loads(message.payload))
 
     def test_full_device_registration_request(self):
         """Test registration request for full device template."""
-        json_registration_protocol = JsonRegistrationProtocol()
-
         device_name = "full_device"
         device_key = "full_key"
         temperature_sensor = SensorTemplate(
@@ -276,134 +269,216 @@ class JsonRegistrationProtocolTests(unittest.TestCase):
             device_name, device_key, device_template
         )
 
-        expected_payload = json.loads(
-            "{"
-            + '"name": "full_device",'
-            + '"deviceKey": "full_key",'
-            + '"defaultBinding": true,'
-            + '"typeParameters": {},'
-            + '"connectivityParameters": {},'
-            + '"firmwareUpdateType": "DFU",'
-            + '"sensors": ['
-            + "  {"
-            + '    "name": "Temperature",'
-            + '    "reference": "T",'
-            + '    "description": "A temperature sensor",'
-            + '    "unit": {'
-            + '      "readingTypeName": "TEMPERATURE",'
-            + '      "symbol": "℃"'
-            + "    }"
-            + "  },"
-            + "  {"
-            + '    "name": "Pressure",'
-            + '    "reference": "P",'
-            + '    "description": "A pressure sensor",'
-            + '    "unit": {'
-            + '      "readingTypeName": "PRESSURE",'
-            + '      "symbol": "mb"'
-            + "    }"
-            + "  },"
-            + "  {"
-            + '    "name": "Humidity",'
-            + '    "reference": "H",'
-            + '    "description": "A humidity sensor",'
-            + '    "unit": {'
-            + '      "readingTypeName": "HUMIDITY",'
-            + '      "symbol": "%"'
-            + "    }"
-            + "  },"
-            + "  {"
-            + '    "name": "Accelerometer",'
-            + '    "reference": "ACL",'
-            + '    "description": "An accelerometer sensor",'
-            + '    "unit": {'
-            + '      "readingTypeName": "ACCELEROMETER",'
-            + '      "symbol": "m/s²"'
-            + "    }"
-            + "  }"
-            + "],"
-            + '"actuators": ['
-            + "  {"
-            + '    "name": "Switch",'
-            + '    "reference": "SW",'
-            + '    "unit": {'
-            + '      "readingTypeName": "SWITCH(ACTUATOR)",'
-            + '      "symbol": ""'
-            + "    },"
-            + '    "description": ""'
-            + "  },"
-            + "  {"
-            + '    "name": "Slider",'
-            + '    "reference": "SL",'
-            + '    "unit": {'
-            + '      "readingTypeName": "COUNT(ACTUATOR)",'
-            + '      "symbol": "count"'
-            + "    },"
-            + '    "description": ""'
-            + "  }"
-            + "],"
-            + '"alarms": ['
-            + "  {"
-            + '    "name": "High Humidity",'
-            + '    "reference": "HH",'
-            + '    "description": "High humidity has been detected"'
-            + "  }"
-            + "],"
-            + '"configurations": ['
-            + "  {"
-            + '    "name": "configuration_1",'
-            + '    "reference": "config_1",'
-            + '    "dataType": "NUMERIC",'
-            + '    "labels": []'
-            + "  },"
-            + "  {"
-            + '    "name": "configuration_2",'
-            + '    "reference": "config_2",'
-            + '    "dataType": "BOOLEAN",'
-            + '    "labels": []'
-            + "  },"
-            + "  {"
-            + '    "name": "configuration_3",'
-            + '    "reference": "config_3",'
-            + '    "dataType": "STRING",'
-            + '    "labels": []'
-            + "  },"
-            + "  {"
-            + '    "name": "configuration_4",'
-            + '    "reference": "config_4",'
-            + '    "dataType": "STRING",'
-            + '    "size": 3,'
-            + '    "labels": "a,b,c"'
-            + "  }"
-            + "],"
-            + '"firmwareUpdateParameters": {'
-            + '  "supportsFirmwareUpdate": true}'
-            + "}"
-        )
-
-        message = json_registration_protocol.make_registration_message(
+        expected_payload = {
+            "name": "full_device",
+            "deviceKey": "full_key",
+            "defaultBinding": True,
+            "typeParameters": {},
+            "connectivityParameters": {},
+            "firmwareUpdateType": "DFU",
+            "sensors": [
+                {
+                    "name": "Temperature",
+                    "reference": "T",
+                    "description": "A temperature sensor",
+                    "unit": {"readingTypeName": "TEMPERATURE", "symbol": "℃"},
+                },
+                {
+                    "name": "Pressure",
+                    "reference": "P",
+                    "description": "A pressure sensor",
+                    "unit": {"readingTypeName": "PRESSURE", "symbol": "mb"},
+                },
+                {
+                    "name": "Humidity",
+                    "reference": "H",
+                    "description": "A humidity sensor",
+                    "unit": {"readingTypeName": "HUMIDITY", "symbol": "%"},
+                },
+                {
+                    "name": "Accelerometer",
+                    "reference": "ACL",
+                    "description": "An accelerometer sensor",
+                    "unit": {
+                        "readingTypeName": "ACCELEROMETER",
+                        "symbol": "m/s²",
+                    },
+                },
+            ],
+            "actuators": [
+                {
+                    "name": "Switch",
+                    "reference": "SW",
+                    "unit": {
+                        "readingTypeName": "SWITCH(ACTUATOR)",
+                        "symbol": "",
+                    },
+                    "description": "",
+                },
+                {
+                    "name": "Slider",
+                    "reference": "SL",
+                    "unit": {
+                        "readingTypeName": "COUNT(ACTUATOR)",
+                        "symbol": "count",
+                    },
+                    "description": "",
+                },
+            ],
+            "alarms": [
+                {
+                    "name": "High Humidity",
+                    "reference": "HH",
+                    "description": "High humidity has been detected",
+                }
+            ],
+            "configurations": [
+                {
+                    "name": "configuration_1",
+                    "reference": "config_1",
+                    "dataType": "NUMERIC",
+                    "labels": [],
+                },
+                {
+                    "name": "configuration_2",
+                    "reference": "config_2",
+                    "dataType": "BOOLEAN",
+                    "labels": [],
+                },
+                {
+                    "name": "configuration_3",
+                    "reference": "config_3",
+                    "dataType": "STRING",
+                    "labels": [],
+                },
+                {
+                    "name": "configuration_4",
+                    "reference": "config_4",
+                    "dataType": "STRING",
+                    "size": 3,
+                    "labels": "a,b,c",
+                },
+            ],
+            "firmwareUpdateParameters": {"supportsFirmwareUpdate": True},
+        }
+
+        message = self.json_registration_protocol.make_registration_message(
             device_registration_request
         )
 
+        self.assertIsInstance(message.payload, bytes)
         self.assertEqual(expected_payload, json.loads(message.payload))
 
+    def test_registration_payload_is_utf8_bytes(self):
+        """Test registration payload is encoded once, as UTF-8 bytes."""
+        device_template = DeviceTemplate(
+            sensors=[
+                SensorTemplate(
+                    "Temperature",
+                    "T",
+                    reading_type_name=ReadingTypeName.TEMPERATURE,
+                    unit=ReadingTypeMeasurementUnit.CELSIUS,
+                )
+            ]
+        )
+        device_registration_request = DeviceRegistrationRequest(
+            "bytes_device", "bytes_key", device_template
+        )
+
+        message = self.json_registration_protocol.make_registration_message(
+            device_registration_request
+        )
 
-def test_make_registration_response(self):
-    """Test for valid response parsing."""
-    json_registration_protocol = JsonRegistrationProtocol()
-    message = Message(
-        "", '{"payload":{"device_key":"some_key"}, "result":"OK"}'
-    )
+        self.assertIsInstance(message.payload, bytes)
+        self.assertIn("℃".encode("utf-8"), message.payload)
 
-    expected = DeviceRegistrationResponse(
-        "some_key", DeviceRegistrationResponseResult.OK
-    )
+    def test_registration_payload_rebuilt_for_changed_template(self):
+        """Test that changing the template produces a new payload."""
+        device_template = DeviceTemplate()
+        device_registration_request = DeviceRegistrationRequest(
+            "changed_device", "changed_key", device_template
+        )
 
-    deserialized = json_registration_protocol.make_registration_response(
-        message
-    )
+        self.json_registration_protocol.make_registration_message(
+            device_registration_request
+        )
+        device_template.sensors.append(
+            SensorTemplate("Counter", "C", DataType.NUMERIC)
+        )
+        message = self.json_registration_protocol.make_registration_message(
+            device_registration_request
+        )
+
+        self.assertEqual(
+            "C", json.loads(message.payload)["sensors"][0]["reference"]
+        )
+
+    def test_registration_payloads_for_shared_template(self):
+        """Test that devices sharing a template get their own payloads."""
+        device_template = DeviceTemplate(
+            sensors=[SensorTemplate("Counter", "C", DataType.NUMERIC)]
+        )
+
+        first = self.json_registration_protocol.make_registration_message(
+            DeviceRegistrationRequest("first", "first_key", device_template)
+        )
+        second = self.json_registration_protocol.make_registration_message(
+            DeviceRegistrationRequest("second", "second_key", device_template)
+        )
+
+        first_payload = json.loads(first.payload)
+        second_payload = json.loads(second.payload)
+        self.assertEqual("first_key", first_payload.pop("deviceKey"))
+        self.assertEqual("second_key", second_payload.pop("deviceKey"))
+        self.assertEqual("first", first_payload.pop("name"))
+        self.assertEqual("second", second_payload.pop("name"))
+        self.assertEqual(first_payload, second_payload)
+
+    def test_registration_message_does_not_modify_template(self):
+        """Test that firmware update support is not added to the template."""
+        device_template = DeviceTemplate(supports_firmware_update=True)
+
+        message = self.json_registration_protocol.make_registration_message(
+            DeviceRegistrationRequest("pure", "pure_key", device_template)
+        )
+
+        self.assertEqual({}, device_template.firmware_update_parameters)
+        self.assertEqual(
+            {"supportsFirmwareUpdate": True},
+            json.loads(message.payload)["firmwareUpdateParameters"],
+        )
+
+    def test_make_registration_response(self):
+        """Test for valid response parsing."""
+        message = Message(
+            "", '{"payload":{"deviceKey":"some_key"}, "result":"OK"}'
+        )
+
+        expected = DeviceRegistrationResponse(
+            "some_key", DeviceRegistrationResponseResult.OK
+        )
+
+        deserialized = (
+            self.json_registration_protocol.make_registration_response(message)
+        )
+
+        self.assertEqual(expected, deserialized)
+
+    def test_make_registration_response_unknown_result(self):
+        """Test that unrecognized result is parsed as unknown error."""
+        message = Message(
+            "", '{"payload":{"deviceKey":"some_key"}, "result":"NOT_A_RESULT"}'
+        )
+
+        expected = DeviceRegistrationResponse(
+            "some_key", DeviceRegistrationResponseResult.ERROR_UNKNOWN
+        )
+
+        deserialized = (
+            self.json_registration_protocol.make_registration_response(message)
+        )
 
-    self.assertEqual(expected, deserialized)
+        self.assertEqual(expected, deserialized)
 
 
 if __name__ == "__main__":
@@ -12,12 +12,8 @@
 #   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
-import json
-import sys
 import unittest
 
-sys.path.append("..")  # noqa
-
 from wolk_gateway_module.json_status_protocol import JsonStatusProtocol
 from wolk_gateway_module.model.device_status import DeviceStatus
 from wolk_gateway_module.model.message import Message
@@ -64,7 +60,7 @@ class JsonStatusProtocolTests(unittest.TestCase):
             self.DEVICE_STATUS_RESPONSE_TOPIC_ROOT
             + self.DEVICE_PATH_PREFIX
             + device_key,
-            json.dumps({"state": status.value}),
+            f'{{"state":"{status.value}"}}',
         )
 
         serialized = json_status_protocol.make_device_status_response_message(
@@ -83,7 +79,7 @@ class JsonStatusProtocolTests(unittest.TestCase):
             self.DEVICE_STATUS_UPDATE_TOPIC_ROOT
             + self.DEVICE_PATH_PREFIX
             + device_key,
-            json.dumps({"state": status.value}),
+            f'{{"state":"{status.value}"}}',
         )
 
         serialized = json_status_protocol.make_device_status_update_message(
@@ -97,7 +93,9 @@ class JsonStatusProtocolTests(unittest.TestCase):
         json_status_protocol = JsonStatusProtocol()
         keys = ["device1", "device2", "device3"]
 
-        expected = Message(self.LAST_WILL_TOPIC, json.dumps(keys))
+        expected = Message(
+            self.LAST_WILL_TOPIC, '["device1","device2","device3"]'
+        )
 
         serialized = json_status_protocol.make_last_will_message(keys)
 
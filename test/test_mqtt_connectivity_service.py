@@ -13,11 +13,11 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 import logging
-import sys
 import unittest
+from threading import Timer
+from time import monotonic
 from unittest.mock import MagicMock
-
-sys.path.append("..")  # noqa
+from unittest.mock import patch
 
 from wolk_gateway_module.mqtt_connectivity_service import (
     MQTTConnectivityService,
@@ -32,32 +32,42 @@ class MQTTConnectivityServiceTests(unittest.TestCase):
         """Mock function for inbound message listener."""
         self.message = message
 
+    @classmethod
+    def setUpClass(cls):
+        """Create the service shared by all tests."""
+        cls.host = "localhost"
+        cls.port = 1883
+        cls.client_id = "WolkGatewayModule-SDK-Python"
+        cls.qos = 0
+        cls.mqttcs = MQTTConnectivityService(
+            cls.host,
+            cls.port,
+            cls.client_id,
+            cls.qos,
+            Message("lastwill"),
+            [],
+        )
+        cls.mqttcs.log.setLevel(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean context after all tests completed."""
+        cls.mqttcs.disconnect()
+        for handler in cls.mqttcs.log.handlers:
+            handler.close()
+        cls.mqttcs = None
+
     def setUp(self):
-        """Prepare context for testing."""
-        self.host = "localhost"
-        self.port = 1883
-        self.client_id = "WolkGatewayModule-SDK-Python"
-        self.qos = 0
+        """Reset shared service state before each test."""
         self.lastwill_message = Message("lastwill")
         self.topics = []
         self.listener = self.mock_listener
         self.message = None
-        self.mqttcs = MQTTConnectivityService(
-            self.host,
-            self.port,
-            self.client_id,
-            self.qos,
-            self.lastwill_message,
-            self.topics,
-        )
-        self.mqttcs.log.setLevel(logging.CRITICAL)
-
-    def tearDown(self):
-        """Clean context from completed test."""
-        self.mqttcs.disconnect()
-        for handler in self.mqttcs.log.handlers:
-            handler.close()
-        self.mqttcs = None
+        self.mqttcs.lastwill_message = self.lastwill_message
+        self.mqttcs.topics = self.topics
+        self.mqttcs.inbound_message_listener = lambda message: None
+        self.mqttcs._connected = False
+        self.mqttcs.connected_rc = None
 
     def test_set_inbound_message_listener(self):
         """Test that inbound message listener is set correctly."""
@@ -78,11 +88,12 @@ class MQTTConnectivityServiceTests(unittest.TestCase):
     def test_set_lastwill_message_when_connected(self):
         """Test that lastwill message is set correctly when connected."""
         message = Message("lastwill")
-        self.mqttcs.disconnect = MagicMock()
-        self.mqttcs.connect = MagicMock()
         self.mqttcs._connected = True
 
-        self.mqttcs.set_lastwill_message(message)
+        with patch.object(self.mqttcs, "disconnect"), patch.object(
+            self.mqttcs, "connect"
+        ):
+            self.mqttcs.set_lastwill_message(message)
 
         self.assertEqual(message, self.mqttcs.lastwill_message)
 
@@ -126,16 +137,58 @@ class MQTTConnectivityServiceTests(unittest.TestCase):
 
     def test_connected(self):
         """Test connected returns false."""
-        self.mqttcs.client.is_connected = MagicMock(return_value=False)
-        self.assertFalse(self.mqttcs.connected())
+        with patch.object(
+            self.mqttcs.client, "is_connected", return_value=False
+        ):
+            self.assertFalse(self.mqttcs.connected())
+
+    def connack_after_loop_start(self, rc):
+        """Deliver CONNACK from another thread like the network loop."""
+
+        def loop_start():
+            Timer(
+                0.01, self.mqttcs._on_mqtt_connect, (None, None, 0, rc)
+            ).start()
+
+        return loop_start
+
+    def test_connect(self):
+        """Test that connect succeeds once CONNACK accepts connection."""
+        with patch.object(self.mqttcs.client, "connect"), patch.object(
+            self.mqttcs.client,
+            "loop_start",
+            side_effect=self.connack_after_loop_start(0),
+        ), patch.object(self.mqttcs.client, "subscribe"):
+            self.assertTrue(self.mqttcs.connect())
+        self.assertTrue(self.mqttcs.connected())
+
+    def test_connect_subscribes_in_one_request(self):
+        """Test that all topics are subscribed to with one request."""
+        self.mqttcs.topics = ["first", "second"]
+
+        with patch.object(self.mqttcs.client, "subscribe") as subscribe:
+            self.mqttcs._on_mqtt_connect(None, None, 0, 0)
+
+        subscribe.assert_called_once_with([("first", 2), ("second", 2)])
+
+    def test_connect_refused(self):
+        """Test that refused connection is reported without timing out."""
+        started = monotonic()
+        with patch.object(self.mqttcs.client, "connect"), patch.object(
+            self.mqttcs.client,
+            "loop_start",
+            side_effect=self.connack_after_loop_start(5),
+        ):
+            self.assertFalse(self.mqttcs.connect())
+        self.assertLess(monotonic() - started, 1)
+        self.assertEqual(5, self.mqttcs.connected_rc)
 
     def test_reconnect(self):
         """Test that reconnection method will call connect."""
         self.mqttcs.connected_rc = 0
 
-        self.mqttcs.connect = MagicMock(return_value=True)
-
-        self.assertTrue(self.mqttcs.reconnect())
+        with patch.object(self.mqttcs, "connect", return_value=True):
+            self.assertTrue(self.mqttcs.reconnect())
 
     def test_publish_fails(self):
         """Test that publishing fails when not connected."""
@@ -143,6 +196,112 @@ class MQTTConnectivityServiceTests(unittest.TestCase):
 
         self.assertFalse(self.mqttcs.publish(message))
 
+    def test_publish_many_fails(self):
+        """Test that publishing many fails when not connected."""
+        messages = [Message("test1"), Message("test2")]
+
+        self.assertEqual(0, self.mqttcs.publish_many(messages))
+
+    def test_publish_qos_0_failure(self):
+        """Test that failed QoS 0 publish does not check delivery."""
+        self.mqttcs._connected = True
+        info = MagicMock(rc=4)
+
+        with patch.object(self.mqttcs.client, "publish", return_value=info):
+            self.assertFalse(self.mqttcs.publish(Message("test")))
+
+        info.is_published.assert_not_called()
+
+    def test_publish_many_stops_at_failure(self):
+        """Test that publishing many stops at first failed message."""
+        messages = [Message("test1"), Message("test2"), Message("test3")]
+        self.mqttcs._connected = True
+        results = [MagicMock(rc=0), MagicMock(rc=4), MagicMock(rc=0)]
+
+        with patch.object(
+            self.mqttcs.client, "publish", side_effect=results
+        ) as publish:
+            self.assertEqual(1, self.mqttcs.publish_many(messages))
+
+        self.assertEqual(2, publish.call_count)
+
+    def test_publish_in_background_queues_message(self):
+        """Test that publishing in background only queues the message."""
+        message = Message("test")
+        self.mqttcs.publish_in_background = True
+
+        try:
+            with patch.object(self.mqttcs.client, "publish") as publish:
+                self.assertTrue(self.mqttcs.publish(message))
+                self.assertEqual(1, self.mqttcs.publish_many([message]))
+
+            publish.assert_not_called()
+            self.assertEqual([message, message], list(self.mqttcs._pending))
+        finally:
+            self.mqttcs.publish_in_background = False
+            self.mqttcs._pending.clear()
+
+    def test_drain_pending_keeps_failed_message(self):
+        """Test that draining stops and requeues the failed message."""
+        messages = [Message("test1"), Message("test2"), Message("test3")]
+        self.mqttcs._connected = True
+        self.mqttcs._pending.extend(messages)
+        results = [MagicMock(rc=0), MagicMock(rc=4)]
+
+        try:
+            with patch.object(
+                self.mqttcs.client, "publish", side_effect=results
+            ):
+                self.assertEqual(1, self.mqttcs._drain_pending())
+
+            self.assertEqual(messages[1:], list(self.mqttcs._pending))
+        finally:
+            self.mqttcs._pending.clear()
+
+    def test_disconnect_publishes_pending_before_lastwill(self):
+        """Test that queued messages are published before the last will."""
+        messages = [Message("test1"), Message("test2")]
+        self.mqttcs._connected = True
+        self.mqttcs._pending.extend(messages)
+
+        try:
+            with patch.object(
+                self.mqttcs.client, "publish", return_value=MagicMock(rc=0)
+            ) as publish, patch.object(
+                self.mqttcs.client, "disconnect"
+            ), patch.object(
+                self.mqttcs.client, "loop_stop"
+            ):
+                self.mqttcs.disconnect()
+
+            self.assertEqual(
+                ["test1", "test2", "lastwill"],
+                [call.args[0] for call in publish.call_args_list],
+            )
+            self.assertEqual([], list(self.mqttcs._pending))
+        finally:
+            self.mqttcs._pending.clear()
+
+    def test_disconnect_keeps_unpublished_pending(self):
+        """Test that messages which could not be published stay queued."""
+        messages = [Message("test1"), Message("test2")]
+        self.mqttcs._connected = True
+        self.mqttcs._pending.extend(messages)
+
+        try:
+            with patch.object(
+                self.mqttcs.client, "publish", return_value=MagicMock(rc=4)
+            ), patch.object(self.mqttcs.client, "disconnect"), patch.object(
+                self.mqttcs.client, "loop_stop"
+            ), patch.object(
+                self.mqttcs, "FLUSH_TIMEOUT", 0
+            ):
+                self.mqttcs.disconnect()
+
+            self.assertEqual(messages, list(self.mqttcs._pending))
+        finally:
+            self.mqttcs._pending.clear()
+
 
 if __name__ == "__main__":
     unittest.main()
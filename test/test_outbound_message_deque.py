@@ -12,11 +12,8 @@
 #   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
-import sys
 import unittest
 
-sys.path.append("..")  # noqa
-
 from wolk_gateway_module.outbound_message_deque import OutboundMessageDeque
 from wolk_gateway_module.model.message import Message
 
@@ -46,6 +43,17 @@ class OutboundMessageDequeTests(unittest.TestCase):
 
         self.assertEqual(None, deque.get())
 
+    def test_get_batch(self):
+        """Test getting first messages from storage without removing them."""
+        deque = OutboundMessageDeque()
+        deque.put(1)
+        deque.put(2)
+        deque.put(3)
+
+        self.assertEqual([1, 2], deque.get_batch(2))
+        self.assertEqual([1, 2, 3], deque.get_batch(5))
+        self.assertEqual(3, deque.queue_size())
+
     def test_queue_size(self):
         """Test getting queue storage size."""
         deque = OutboundMessageDeque()
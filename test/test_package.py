@@ -0,0 +1,47 @@
+"""Tests for wolk_gateway_module package exports."""
+#   Copyright 2020 WolkAbout Technology s.r.o.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+import unittest
+
+import wolk_gateway_module
+from wolk_gateway_module.wolk import Wolk
+
+
+class PackageTests(unittest.TestCase):
+    """Package Tests."""
+
+    def test_all_names_resolve(self):
+        """Test that every name in __all__ can be accessed."""
+        for name in wolk_gateway_module.__all__:
+            with self.subTest(name=name):
+                self.assertTrue(hasattr(wolk_gateway_module, name))
+
+    def test_lazy_name_is_defining_object(self):
+        """Test that lazily imported name is the object from its module."""
+        self.assertIs(Wolk, wolk_gateway_module.Wolk)
+
+    def test_dir_lists_public_names(self):
+        """Test that dir lists names which were not imported yet."""
+        self.assertTrue(
+            set(wolk_gateway_module.__all__).issubset(dir(wolk_gateway_module))
+        )
+
+    def test_unknown_name(self):
+        """Test that accessing unknown name raises AttributeError."""
+        with self.assertRaises(AttributeError):
+            wolk_gateway_module.NotAName  # noqa
+
+
+if __name__ == "__main__":
+    unittest.main()
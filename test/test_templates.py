@@ -0,0 +1,74 @@
+"""Tests for device registration templates."""
+#   Copyright 2020 WolkAbout Technology s.r.o.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+import unittest
+
+from wolk_gateway_module.model.actuator_template import ActuatorTemplate
+from wolk_gateway_module.model.configuration_template import (
+    ConfigurationTemplate,
+)
+from wolk_gateway_module.model.data_type import DataType
+from wolk_gateway_module.model.sensor_template import SensorTemplate
+
+
+class TemplateTests(unittest.TestCase):
+    """Template Tests."""
+
+    def test_actuator_template_is_hashable(self):
+        """Test that actuator templates hash and compare by identity."""
+        first = ActuatorTemplate("Switch", "SW", DataType.BOOLEAN)
+        second = ActuatorTemplate("Switch", "SW", DataType.BOOLEAN)
+
+        self.assertEqual(2, len({first, second}))
+        self.assertNotEqual(first, second)
+
+    def test_configuration_template_is_hashable(self):
+        """Test that configuration templates hash and compare by identity."""
+        first = ConfigurationTemplate("Mode", "M", DataType.STRING)
+        second = ConfigurationTemplate("Mode", "M", DataType.STRING)
+
+        self.assertEqual(2, len({first, second}))
+        self.assertNotEqual(first, second)
+
+    def test_sensor_template_is_hashable(self):
+        """Test that sensor templates hash and compare by identity."""
+        first = SensorTemplate("Counter", "C", DataType.NUMERIC)
+        second = SensorTemplate("Counter", "C", DataType.NUMERIC)
+
+        self.assertEqual(2, len({first, second}))
+        self.assertNotEqual(first, second)
+
+    def test_generic_sensor_templates_have_own_reading_type(self):
+        """Test that changing one sensor's unit leaves others unchanged."""
+        first = SensorTemplate("Counter", "C", DataType.NUMERIC)
+        first.unit.unit = "X"
+        second = SensorTemplate("Counter", "C", DataType.NUMERIC)
+
+        self.assertEqual("", second.to_dto()["unit"]["symbol"])
+
+    def test_named_sensor_templates_have_own_reading_type(self):
+        """Test that sensors with the same custom unit do not share it."""
+        first = SensorTemplate("Custom", "C", reading_type_name="N", unit="u")
+        second = SensorTemplate("Custom", "C", reading_type_name="N", unit="u")
+
+        self.assertIsNot(first.unit, second.unit)
+
+    def test_sensor_template_invalid_reading_type_name(self):
+        """Test that invalid reading type name raises ValueError."""
+        with self.assertRaises(ValueError):
+            SensorTemplate("Custom", "C", reading_type_name=["x"], unit="u")
+
+
+if __name__ == "__main__":
+    unittest.main()
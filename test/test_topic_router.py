@@ -0,0 +1,65 @@
+"""Tests for TopicRouter."""
+#   Copyright 2020 WolkAbout Technology s.r.o.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+import unittest
+
+from wolk_gateway_module.topic_router import JSON_INBOUND_TOPIC_PREFIXES
+from wolk_gateway_module.topic_router import TopicRouter
+
+
+class TopicRouterTests(unittest.TestCase):
+    """Topic Router Tests."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Index the default JSON protocol prefixes once."""
+        cls.router = TopicRouter(JSON_INBOUND_TOPIC_PREFIXES)
+
+    def test_route_every_kind(self):
+        """Test that a topic under each prefix is routed to its kind."""
+        for kind, prefix in JSON_INBOUND_TOPIC_PREFIXES.items():
+            with self.subTest(kind=kind):
+                self.assertEqual(
+                    kind, self.router.route(prefix + "d/some_key/r/REF")
+                )
+
+    def test_route_unknown_topic(self):
+        """Test that an unknown topic is not routed."""
+        self.assertIsNone(
+            self.router.route("d2p/sensor_reading/d/some_key/r/REF")
+        )
+
+    def test_route_prefix_only_at_start(self):
+        """Test that a prefix in the middle of a topic is not routed."""
+        self.assertIsNone(
+            self.router.route(
+                "x/" + JSON_INBOUND_TOPIC_PREFIXES["actuator_set"]
+            )
+        )
+
+    def test_prefix_matches_whole_levels(self):
+        """Test that a prefix only matches complete topic levels."""
+        router = TopicRouter({"kind": "a/b/"})
+        self.assertEqual("kind", router.route("a/b/c"))
+        self.assertIsNone(router.route("a/bc/d"))
+        self.assertIsNone(router.route("a/b"))
+
+    def test_prefix_must_end_with_delimiter(self):
+        """Test that a prefix not ending in a topic level is rejected."""
+        with self.assertRaises(ValueError):
+            TopicRouter({"partial": "p2d/actuator"})
+
+
+if __name__ == "__main__":
+    unittest.main()
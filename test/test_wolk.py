@@ -12,13 +12,11 @@
 #   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
+import json
 import logging
-import sys
 import unittest
 from typing import List
 
-sys.path.append("..")  # noqa
-
 from wolk_gateway_module.connectivity.connectivity_service import (
     ConnectivityService,
 )
@@ -35,6 +33,7 @@ from wolk_gateway_module.model.firmware_update_status import (
 )
 from wolk_gateway_module.model.sensor_template import SensorTemplate
 from wolk_gateway_module.model.data_type import DataType
+from wolk_gateway_module.model.reading_type import ReadingType
 from wolk_gateway_module.json_data_protocol import JsonDataProtocol
 from wolk_gateway_module.json_status_protocol import JsonStatusProtocol
 from wolk_gateway_module.json_firmware_update_protocol import (
@@ -195,6 +194,38 @@ class WolkTests(unittest.TestCase):
         wolk.publish()
         self.assertEqual(0, wolk.outbound_message_queue.queue_size())
 
+    def test_publish_all_stored_messages(self):
+        """Test publishing stored messages for all devices."""
+        wolk = Wolk(
+            "host",
+            1883,
+            "module_name",
+            lambda a: a,
+            connectivity_service=MockConnectivityService(),
+        )
+        for value in range(150):
+            wolk.add_sensor_reading("device_key", "REF", value)
+        wolk.add_sensor_reading("other_key", "REF", 15)
+        wolk.connectivity_service._connected = True
+        wolk.publish()
+        self.assertEqual(0, wolk.outbound_message_queue.queue_size())
+
+    def test_publish_for_device(self):
+        """Test publishing stored messages only for given device."""
+        wolk = Wolk(
+            "host",
+            1883,
+            "module_name",
+            lambda a: a,
+            connectivity_service=MockConnectivityService(),
+        )
+        wolk.add_sensor_reading("device_key", "REF", 13)
+        wolk.add_sensor_reading("device_key", "REF", 14)
+        wolk.add_sensor_reading("other_key", "REF", 15)
+        wolk.connectivity_service._connected = True
+        wolk.publish("device_key")
+        self.assertEqual(1, wolk.outbound_message_queue.queue_size())
+
     def test_add_alarm(self):
         """Test adding a alarm event to storage and then publish."""
         wolk = Wolk(
@@ -417,6 +448,37 @@ class WolkTests(unittest.TestCase):
 
         self.assertEqual(1, wolk.outbound_message_queue.queue_size())
 
+    def test_readd_device_publishes_updated_registration(self):
+        """Test re-adding a device after changing its sensor registers it."""
+        wolk = Wolk(
+            "host",
+            1883,
+            "module_name",
+            lambda device_key: DeviceStatus.CONNECTED,
+            connectivity_service=MockConnectivityService(),
+        )
+        wolk.log.setLevel(logging.CRITICAL)
+
+        sensor1 = SensorTemplate("sensor1", "s1", DataType.NUMERIC)
+        device = Device("device1", "key1", DeviceTemplate(sensors=[sensor1]))
+
+        wolk.add_device(device)
+        wolk.remove_device(device.key)
+        sensor1.name = "renamed"
+        sensor1.unit = ReadingType(name="CUSTOM", unit="c")
+        wolk.add_device(device)
+
+        registration = list(wolk.outbound_message_queue.queue)[-1]
+        self.assertEqual(
+            {
+                "name": "renamed",
+                "reference": "s1",
+                "description": "",
+                "unit": {"readingTypeName": "CUSTOM", "symbol": "c"},
+            },
+            json.loads(registration.payload)["sensors"][0],
+        )
+
     def test_bad_actuation_handler_not_callable(self):
         """Test passing something that isn't callable raises ValueError."""
         with self.assertRaises(ValueError):
@@ -14,43 +14,52 @@
 #   limitations under the License.
 __version__ = "1.0.9"
 
-from .connectivity.connectivity_service import ConnectivityService
-from .interface.actuation_handler import handle_actuation
-from .interface.actuator_status_provider import get_actuator_status
-from .interface.configuration_handler import handle_configuration
-from .interface.configuration_provider import get_configuration
-from .interface.device_status_provider import get_device_status
-from .interface.firmware_handler import FirmwareHandler
-from .logger_factory import logging_config
-from .model.actuator_command import ActuatorCommand
-from .model.actuator_state import ActuatorState
-from .model.actuator_status import ActuatorStatus
-from .model.actuator_template import ActuatorTemplate
-from .model.alarm import Alarm
-from .model.alarm_template import AlarmTemplate
-from .model.configuration_command import ConfigurationCommand
-from .model.configuration_template import ConfigurationTemplate
-from .model.data_type import DataType
-from .model.device import Device
-from .model.device_registration_request import DeviceRegistrationRequest
-from .model.device_registration_response import DeviceRegistrationResponse
-from .model.device_status import DeviceStatus
-from .model.device_template import DeviceTemplate
-from .model.firmware_update_status import FirmwareUpdateErrorCode
-from .model.firmware_update_status import FirmwareUpdateState
-from .model.firmware_update_status import FirmwareUpdateStatus
-from .model.message import Message
-from .model.reading_type import ReadingType
-from .model.reading_type_measurement_unit import ReadingTypeMeasurementUnit
-from .model.reading_type_name import ReadingTypeName
-from .model.sensor_reading import SensorReading
-from .model.sensor_template import SensorTemplate
-from .persistence.outbound_message_queue import OutboundMessageQueue
-from .protocol.data_protocol import DataProtocol
-from .protocol.firmware_update_protocol import FirmwareUpdateProtocol
-from .protocol.registration_protocol import RegistrationProtocol
-from .protocol.status_protocol import StatusProtocol
-from .wolk import Wolk
+from importlib import import_module
+from typing import Any
+from typing import List
+
+# Public names are imported from their modules on first access (PEP 562),
+# so importing the package does not pull in paho-mqtt and every protocol
+# until they are actually used.
+_LAZY_IMPORTS = {
+    "ConnectivityService": ".connectivity.connectivity_service",
+    "handle_actuation": ".interface.actuation_handler",
+    "get_actuator_status": ".interface.actuator_status_provider",
+    "handle_configuration": ".interface.configuration_handler",
+    "get_configuration": ".interface.configuration_provider",
+    "get_device_status": ".interface.device_status_provider",
+    "FirmwareHandler": ".interface.firmware_handler",
+    "logging_config": ".logger_factory",
+    "ActuatorCommand": ".model.actuator_command",
+    "ActuatorState": ".model.actuator_state",
+    "ActuatorStatus": ".model.actuator_status",
+    "ActuatorTemplate": ".model.actuator_template",
+    "Alarm": ".model.alarm",
+    "AlarmTemplate": ".model.alarm_template",
+    "ConfigurationCommand": ".model.configuration_command",
+    "ConfigurationTemplate": ".model.configuration_template",
+    "DataType": ".model.data_type",
+    "Device": ".model.device",
+    "DeviceRegistrationRequest": ".model.device_registration_request",
+    "DeviceRegistrationResponse": ".model.device_registration_response",
+    "DeviceStatus": ".model.device_status",
+    "DeviceTemplate": ".model.device_template",
+    "FirmwareUpdateErrorCode": ".model.firmware_update_status",
+    "FirmwareUpdateState": ".model.firmware_update_status",
+    "FirmwareUpdateStatus": ".model.firmware_update_status",
+    "Message": ".model.message",
+    "ReadingType": ".model.reading_type",
+    "ReadingTypeMeasurementUnit": ".model.reading_type_measurement_unit",
+    "ReadingTypeName": ".model.reading_type_name",
+    "SensorReading": ".model.sensor_reading",
+    "SensorTemplate": ".model.sensor_template",
+    "OutboundMessageQueue": ".persistence.outbound_message_queue",
+    "DataProtocol": ".protocol.data_protocol",
+    "FirmwareUpdateProtocol": ".protocol.firmware_update_protocol",
+    "RegistrationProtocol": ".protocol.registration_protocol",
+    "StatusProtocol": ".protocol.status_protocol",
+    "Wolk": ".wolk",
+}
 
 __all__ = [
     "Wolk",
@@ -92,3 +101,21 @@ __all__ = [
     "DeviceStatus",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public name from its module on first access."""
+    try:
+        module = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes including not yet imported public names."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
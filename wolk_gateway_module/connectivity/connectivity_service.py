@@ -102,3 +102,23 @@ class ConnectivityService(ABC):
         :rtype: bool
         """
         raise NotImplementedError
+
+    def publish_many(self, messages: List[Message]) -> int:
+        """
+        Publish serialized data to WolkGateway in order.
+
+        Stops at the first message that could not be published.
+        Implementations may override this to publish the whole batch
+        at a lower cost than calling ``publish`` for every message.
+
+        :param messages: Messages to be published
+        :type messages: List[Message]
+        :returns: number of messages published from the start of the list
+        :rtype: int
+        """
+        published = 0
+        for message in messages:
+            if not self.publish(message):
+                break
+            published += 1
+        return published
@@ -12,12 +12,15 @@
 #   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
-import json
+from typing import Any
 from typing import List
 
+from wolk_gateway_module.json_serialization import dumps
+from wolk_gateway_module.json_serialization import loads
 from wolk_gateway_module.logger_factory import logger_factory
 from wolk_gateway_module.model.actuator_command import ActuatorCommand
 from wolk_gateway_module.model.actuator_command import ActuatorCommandType
+from wolk_gateway_module.model.actuator_state import ActuatorState
 from wolk_gateway_module.model.actuator_status import ActuatorStatus
 from wolk_gateway_module.model.alarm import Alarm
 from wolk_gateway_module.model.configuration_command import (
@@ -30,6 +33,40 @@ from wolk_gateway_module.model.message import Message
 from wolk_gateway_module.model.sensor_reading import SensorReading
 from wolk_gateway_module.protocol.data_protocol import DataProtocol
 
+_ACTUATOR_STATE_VALUES = {state: state.value for state in ActuatorState}
+
+
+def _topic_root(topic: str) -> str:
+    # First two topic levels with the trailing delimiter,
+    # e.g. "p2d/actuator_set/" for "p2d/actuator_set/d/key/r/ref".
+    return topic[: topic.find("/", topic.find("/") + 1) + 1]
+
+
+_NEWLINE_ESCAPES = str.maketrans({"\n": "\\n", "\r": None})
+_CONFIGURATION_VALUE_ESCAPES = str.maketrans(
+    {"\n": "\\n", "\r": None, '"': '\\"'}
+)
+
+
+def _escape_configuration_value(value: Any) -> str:
+    return str(value).translate(_CONFIGURATION_VALUE_ESCAPES)
+
+
+def _serialize_configuration_value(value: Any) -> str:
+    if isinstance(value, tuple):
+        return ",".join(map(_escape_configuration_value, value))
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _serialize_reading_value(value: Any) -> Any:
+    if isinstance(value, tuple):
+        return ",".join(map(str, value))
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return value
+
 
 class JsonDataProtocol(DataProtocol):
     """Parse inbound messages and serialize outbound messages."""
@@ -46,6 +83,24 @@ class JsonDataProtocol(DataProtocol):
     CONFIGURATION_SET = "p2d/configuration_set/"
     CONFIGURATION_GET = "p2d/configuration_get/"
     CONFIGURATION_STATUS = "d2p/configuration_get/"
+    _ACTUATOR_SET_PREFIX = ACTUATOR_SET + DEVICE_PATH_PREFIX
+    _ACTUATOR_GET_PREFIX = ACTUATOR_GET + DEVICE_PATH_PREFIX
+    _CONFIGURATION_SET_PREFIX = CONFIGURATION_SET + DEVICE_PATH_PREFIX
+    _CONFIGURATION_GET_PREFIX = CONFIGURATION_GET + DEVICE_PATH_PREFIX
+    _REFERENCE_INFIX = CHANNEL_DELIMITER + REFERENCE_PATH_PREFIX
+    _REFERENCE_WILDCARD_SUFFIX = _REFERENCE_INFIX + CHANNEL_WILDCARD
+    _SENSOR_READING_PREFIX = SENSOR_READING + DEVICE_PATH_PREFIX
+    _ALARM_PREFIX = ALARM + DEVICE_PATH_PREFIX
+    _ACTUATOR_STATUS_PREFIX = ACTUATOR_STATUS + DEVICE_PATH_PREFIX
+    _CONFIGURATION_STATUS_PREFIX = CONFIGURATION_STATUS + DEVICE_PATH_PREFIX
+    _ACTUATOR_COMMAND_TYPES = {
+        ACTUATOR_SET: ActuatorCommandType.SET,
+        ACTUATOR_GET: ActuatorCommandType.GET,
+    }
+    _CONFIGURATION_COMMAND_TYPES = {
+        CONFIGURATION_SET: ConfigurationCommandType.SET,
+        CONFIGURATION_GET: ConfigurationCommandType.GET,
+    }
 
     def __init__(self) -> None:
         """Create object."""
@@ -71,20 +126,12 @@ class JsonDataProtocol(DataProtocol):
         :rtype: list
         """
         inbound_topics = [
-            self.ACTUATOR_SET
-            + self.DEVICE_PATH_PREFIX
-            + device_key
-            + self.CHANNEL_DELIMITER
-            + self.REFERENCE_PATH_PREFIX
-            + self.CHANNEL_WILDCARD,
-            self.ACTUATOR_GET
-            + self.DEVICE_PATH_PREFIX
-            + device_key
-            + self.CHANNEL_DELIMITER
-            + self.REFERENCE_PATH_PREFIX
-            + self.CHANNEL_WILDCARD,
-            self.CONFIGURATION_SET + self.DEVICE_PATH_PREFIX + device_key,
-            self.CONFIGURATION_GET + self.DEVICE_PATH_PREFIX + device_key,
+            f"{self._ACTUATOR_SET_PREFIX}{device_key}"
+            f"{self._REFERENCE_WILDCARD_SUFFIX}",
+            f"{self._ACTUATOR_GET_PREFIX}{device_key}"
+            f"{self._REFERENCE_WILDCARD_SUFFIX}",
+            self._CONFIGURATION_SET_PREFIX + device_key,
+            self._CONFIGURATION_GET_PREFIX + device_key,
         ]
         self.log.debug(f"Inbound topics for {device_key} : {inbound_topics}")
 
@@ -175,9 +222,9 @@ class JsonDataProtocol(DataProtocol):
         :rtype: str
         """
         if self.REFERENCE_PATH_PREFIX in message.topic:
-            device_key = message.topic.split("/")[-3]
+            device_key = message.topic.rsplit("/", 3)[-3]
         else:
-            device_key = message.topic.split("/")[-1]
+            device_key = message.topic.rpartition("/")[2]
         self.log.debug(f"Made {device_key} from {message}")
 
         return device_key
@@ -192,14 +239,13 @@ class JsonDataProtocol(DataProtocol):
         :returns: actuator_command
         :rtype: ActuatorCommand
         """
-        reference = message.topic.split("/")[-1]
-        if self.is_actuator_set_message(message):
-            command = ActuatorCommandType.SET
-            payload = json.loads(message.payload)  # type: ignore
+        reference = message.topic.rpartition("/")[2]
+        command = self._ACTUATOR_COMMAND_TYPES[_topic_root(message.topic)]
+        if command is ActuatorCommandType.SET:
+            payload = loads(message.payload)  # type: ignore
             value = payload["value"]
-            if "\n" in str(value):
-                value = value.replace("\n", "\\n")
-                value = value.replace("\r", "")
+            if isinstance(value, str):
+                value = value.translate(_NEWLINE_ESCAPES)
 
             if "true" == str(value):
                 value = True
@@ -214,8 +260,7 @@ class JsonDataProtocol(DataProtocol):
                         value = int(value)
                 except (ValueError, TypeError):
                     pass
-        elif self.is_actuator_get_message(message):
-            command = ActuatorCommandType.GET
+        else:
             value = None
 
         actuator_command = ActuatorCommand(reference, command, value)
@@ -235,49 +280,39 @@ class JsonDataProtocol(DataProtocol):
         :returns: configuration_command
         :rtype: ConfigurationCommand
         """
-        if self.is_configuration_set_message(message):
-            command = ConfigurationCommandType.SET
-            payload = json.loads(message.payload)  # type: ignore
+        command = self._CONFIGURATION_COMMAND_TYPES[_topic_root(message.topic)]
+        if command is ConfigurationCommandType.SET:
+            payload = loads(message.payload)  # type: ignore
             for reference, value in payload.items():
-                if "\n" in str(value):
-                    value = value.replace("\n", "\\n")
-                    value = value.replace("\r", "")
+                if not isinstance(value, str):
+                    continue
+                value = value.translate(_NEWLINE_ESCAPES)
 
-                if "true" == str(value):
+                if value == "true":
                     payload[reference] = True
-                elif "false" == str(value):
+                elif value == "false":
                     payload[reference] = False
-
                 else:
                     try:
-                        if any("." in char for char in value):
+                        if "." in value:
                             payload[reference] = float(value)
                         else:
                             payload[reference] = int(value)
-                    except (ValueError, TypeError):
-                        pass
+                    except ValueError:
+                        if "," in value:
+                            items = value.split(",")
+                            try:
+                                if "." in value:
+                                    payload[reference] = tuple(
+                                        map(float, items)
+                                    )
+                                else:
+                                    payload[reference] = tuple(map(int, items))
+                            except ValueError:
+                                payload[reference] = tuple(items)
+            values = payload
 
-                if isinstance(payload[reference], (int, float, bool)):
-                    pass
-                else:
-                    if "," in value:
-                        values_list = value.split(",")
-                        try:
-                            if any("." in value for value in values_list):
-                                values_list = [
-                                    float(value) for value in values_list
-                                ]
-                            else:
-                                values_list = [
-                                    int(value) for value in values_list
-                                ]
-                        except ValueError:
-                            pass
-                        payload[reference] = tuple(values_list)
-                values = payload
-
-        elif self.is_configuration_get_message(message):
-            command = ConfigurationCommandType.GET
+        else:
             values = None
 
         configuration_command = ConfigurationCommand(command, values)
@@ -300,28 +335,18 @@ class JsonDataProtocol(DataProtocol):
         :rtype: Message
         """
         topic = (
-            self.SENSOR_READING
-            + self.DEVICE_PATH_PREFIX
-            + device_key
-            + self.CHANNEL_DELIMITER
-            + self.REFERENCE_PATH_PREFIX
-            + sensor_reading.reference
+            f"{self._SENSOR_READING_PREFIX}{device_key}"
+            f"{self._REFERENCE_INFIX}{sensor_reading.reference}"
         )
 
-        if isinstance(sensor_reading.value, tuple):
-            sensor_reading.value = ",".join(map(str, sensor_reading.value))
-        elif isinstance(sensor_reading.value, bool):
-            sensor_reading.value = str(sensor_reading.value).lower()
+        data = str(_serialize_reading_value(sensor_reading.value))
 
         if sensor_reading.timestamp is not None:
-            payload = json.dumps(
-                {
-                    "data": str(sensor_reading.value),
-                    "utc": int(sensor_reading.timestamp),
-                }
+            payload = dumps(
+                {"data": data, "utc": int(sensor_reading.timestamp)}
             )
         else:
-            payload = json.dumps({"data": str(sensor_reading.value)})
+            payload = dumps({"data": data})
 
         message = Message(topic, payload)
         self.log.debug(
@@ -349,21 +374,19 @@ class JsonDataProtocol(DataProtocol):
         :returns: message
         :rtype: Message
         """
-        topic = self.SENSOR_READING + self.DEVICE_PATH_PREFIX + device_key
+        topic = self._SENSOR_READING_PREFIX + device_key
 
-        payload = {}
-        for sensor_reading in sensor_readings:
-            if isinstance(sensor_reading.value, tuple):
-                sensor_reading.value = ",".join(map(str, sensor_reading.value))
-            elif isinstance(sensor_reading.value, bool):
-                sensor_reading.value = str(sensor_reading.value).lower()
-
-            payload[sensor_reading.reference] = sensor_reading.value
+        payload = {
+            sensor_reading.reference: _serialize_reading_value(
+                sensor_reading.value
+            )
+            for sensor_reading in sensor_readings
+        }
 
         if timestamp is not None:
             payload["utc"] = timestamp
 
-        message = Message(topic, json.dumps(payload))
+        message = Message(topic, dumps(payload))
         self.log.debug(
             f"Made {message} from {sensor_readings} and {device_key} "
             f"and timestamp {timestamp}"
@@ -384,23 +407,19 @@ class JsonDataProtocol(DataProtocol):
         :rtype: Message
         """
         topic = (
-            self.ALARM
-            + self.DEVICE_PATH_PREFIX
-            + device_key
-            + self.CHANNEL_DELIMITER
-            + self.REFERENCE_PATH_PREFIX
-            + alarm.reference
+            f"{self._ALARM_PREFIX}{device_key}"
+            f"{self._REFERENCE_INFIX}{alarm.reference}"
         )
 
         if alarm.timestamp is not None:
-            payload = json.dumps(
+            payload = dumps(
                 {
                     "data": str(alarm.active).lower(),
                     "utc": int(alarm.timestamp),
                 }
             )
         else:
-            payload = json.dumps({"data": str(alarm.active).lower()})
+            payload = dumps({"data": str(alarm.active).lower()})
 
         message = Message(topic, payload)
         self.log.debug(f"Made {message} from {alarm} and {device_key}")
@@ -422,21 +441,18 @@ class JsonDataProtocol(DataProtocol):
         :rtype: Message
         """
         topic = (
-            self.ACTUATOR_STATUS
-            + self.DEVICE_PATH_PREFIX
-            + device_key
-            + self.CHANNEL_DELIMITER
-            + self.REFERENCE_PATH_PREFIX
-            + actuator_status.reference
+            f"{self._ACTUATOR_STATUS_PREFIX}{device_key}"
+            f"{self._REFERENCE_INFIX}{actuator_status.reference}"
         )
 
-        if isinstance(actuator_status.value, bool):
-            actuator_status.value = str(actuator_status.value).lower()
+        value = actuator_status.value
+        if isinstance(value, bool):
+            value = str(value).lower()
 
-        payload = json.dumps(
+        payload = dumps(
             {
-                "status": actuator_status.state.value,
-                "value": str(actuator_status.value),
+                "status": _ACTUATOR_STATE_VALUES[actuator_status.state],
+                "value": str(value),
             }
         )
 
@@ -461,31 +477,16 @@ class JsonDataProtocol(DataProtocol):
         :returns: message
         :rtype: Message
         """
-        topic = (
-            self.CONFIGURATION_STATUS + self.DEVICE_PATH_PREFIX + device_key
-        )
-
-        for reference, config_value in configuration.items():
-            if isinstance(config_value, tuple):
-                values_list = []
-                for value in config_value:
-                    if "\n" in str(value):
-                        value = value.replace("\n", "\\n")
-                        value = value.replace("\r", "")
-
-                    if '"' in str(value):
-                        value = value.replace('"', '\\"')
+        topic = self._CONFIGURATION_STATUS_PREFIX + device_key
 
-                    values_list.append(value)
-
-                configuration[reference] = ",".join(map(str, values_list))
-            else:
-                if isinstance(config_value, bool):
-                    config_value = str(config_value).lower()
-
-                configuration[reference] = str(config_value)
-
-        payload = json.dumps({"values": configuration})
+        payload = dumps(
+            {
+                "values": {
+                    reference: _serialize_configuration_value(config_value)
+                    for reference, config_value in configuration.items()
+                }
+            }
+        )
 
         message = Message(topic, payload)
         self.log.debug(f"Made {message} from {configuration} and {device_key}")
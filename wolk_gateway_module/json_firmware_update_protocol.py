@@ -12,9 +12,15 @@
 #   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
-import json
-
+from wolk_gateway_module.json_serialization import dumps
+from wolk_gateway_module.json_serialization import loads
 from wolk_gateway_module.logger_factory import logger_factory
+from wolk_gateway_module.model.firmware_update_status import (
+    FirmwareUpdateErrorCode,
+)
+from wolk_gateway_module.model.firmware_update_status import (
+    FirmwareUpdateState,
+)
 from wolk_gateway_module.model.firmware_update_status import (
     FirmwareUpdateStatus,
 )
@@ -23,6 +29,9 @@ from wolk_gateway_module.protocol.firmware_update_protocol import (
     FirmwareUpdateProtocol,
 )
 
+_STATE_VALUES = {state: state.value for state in FirmwareUpdateState}
+_ERROR_CODE_VALUES = {code: code.value for code in FirmwareUpdateErrorCode}
+
 
 class JsonFirmwareUpdateProtocol(FirmwareUpdateProtocol):
     """Parse inbound messages and serialize outbound firmware messages."""
@@ -32,6 +41,14 @@ class JsonFirmwareUpdateProtocol(FirmwareUpdateProtocol):
     FIRMWARE_UPDATE_ABORT_TOPIC_ROOT = "p2d/firmware_update_abort/"
     FIRMWARE_UPDATE_STATUS_TOPIC_ROOT = "d2p/firmware_update_status/"
     FIRMWARE_VERSION_UPDATE_TOPIC_ROOT = "d2p/firmware_version_update/"
+    _INSTALL_KEY_PREFIX = (
+        FIRMWARE_UPDATE_INSTALL_TOPIC_ROOT + DEVICE_PATH_PREFIX
+    )
+    _ABORT_KEY_PREFIX = FIRMWARE_UPDATE_ABORT_TOPIC_ROOT + DEVICE_PATH_PREFIX
+    _STATUS_KEY_PREFIX = FIRMWARE_UPDATE_STATUS_TOPIC_ROOT + DEVICE_PATH_PREFIX
+    _VERSION_KEY_PREFIX = (
+        FIRMWARE_VERSION_UPDATE_TOPIC_ROOT + DEVICE_PATH_PREFIX
+    )
 
     def __init__(self) -> None:
         """Create object."""
@@ -57,12 +74,8 @@ class JsonFirmwareUpdateProtocol(FirmwareUpdateProtocol):
         :rtype: list
         """
         inbound_topics = [
-            self.FIRMWARE_UPDATE_INSTALL_TOPIC_ROOT
-            + self.DEVICE_PATH_PREFIX
-            + device_key,
-            self.FIRMWARE_UPDATE_ABORT_TOPIC_ROOT
-            + self.DEVICE_PATH_PREFIX
-            + device_key,
+            self._INSTALL_KEY_PREFIX + device_key,
+            self._ABORT_KEY_PREFIX + device_key,
         ]
         self.log.debug(f"Inbound topics for {device_key} : {inbound_topics}")
         return inbound_topics
@@ -81,16 +94,12 @@ class JsonFirmwareUpdateProtocol(FirmwareUpdateProtocol):
         :returns: message
         :rtype: Message
         """
-        topic = (
-            self.FIRMWARE_UPDATE_STATUS_TOPIC_ROOT
-            + self.DEVICE_PATH_PREFIX
-            + device_key
-        )
-        payload = {"status": status.status.value}
+        topic = self._STATUS_KEY_PREFIX + device_key
+        payload = {"status": _STATE_VALUES[status.status]}
         if status.error_code:
-            payload["error"] = status.error_code.value
+            payload["error"] = _ERROR_CODE_VALUES[status.error_code]
 
-        message = Message(topic, json.dumps(payload))
+        message = Message(topic, dumps(payload))
         self.log.debug(f"Made {message} from {status} and {device_key}")
         return message
 
@@ -108,11 +117,7 @@ class JsonFirmwareUpdateProtocol(FirmwareUpdateProtocol):
         :returns: message
         :rtype: Message
         """
-        topic = (
-            self.FIRMWARE_VERSION_UPDATE_TOPIC_ROOT
-            + self.DEVICE_PATH_PREFIX
-            + device_key
-        )
+        topic = self._VERSION_KEY_PREFIX + device_key
         payload = str(firmware_verison)
 
         message = Message(topic, payload)
@@ -135,8 +140,9 @@ class JsonFirmwareUpdateProtocol(FirmwareUpdateProtocol):
             self.FIRMWARE_UPDATE_INSTALL_TOPIC_ROOT
         )
         self.log.debug(
-            f"Is {message} firmware install command "
-            f"message: {is_firmware_install_command}"
+            "Is %s firmware install command message: %s",
+            message,
+            is_firmware_install_command,
         )
         return is_firmware_install_command
 
@@ -154,8 +160,9 @@ class JsonFirmwareUpdateProtocol(FirmwareUpdateProtocol):
             self.FIRMWARE_UPDATE_ABORT_TOPIC_ROOT
         )
         self.log.debug(
-            f"Is {message} firmware abort command "
-            f"message: {is_firmware_abort_command}"
+            "Is %s firmware abort command message: %s",
+            message,
+            is_firmware_abort_command,
         )
         return is_firmware_abort_command
 
@@ -169,7 +176,7 @@ class JsonFirmwareUpdateProtocol(FirmwareUpdateProtocol):
         :returns: firmware_file_path
         :rtype: str
         """
-        payload = json.loads(message.payload)  # type: ignore
+        payload = loads(message.payload)  # type: ignore
         firmware_file_path = payload["fileName"]
         self.log.debug(f"Made {firmware_file_path} from {message}")
         return firmware_file_path
@@ -184,6 +191,6 @@ class JsonFirmwareUpdateProtocol(FirmwareUpdateProtocol):
         :returns: device_key
         :rtype: str
         """
-        device_key = message.topic.split("/")[-1]
+        device_key = message.topic.rpartition("/")[2]
         self.log.debug(f"Made {device_key} from {message}")
         return device_key
@@ -12,8 +12,10 @@
 #   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
-import json
+from typing import Dict
 
+from wolk_gateway_module.json_serialization import dumps_bytes
+from wolk_gateway_module.json_serialization import loads
 from wolk_gateway_module.logger_factory import logger_factory
 from wolk_gateway_module.model.device_registration_request import (
     DeviceRegistrationRequest,
@@ -24,11 +26,16 @@ from wolk_gateway_module.model.device_registration_response import (
 from wolk_gateway_module.model.device_registration_response_result import (
     DeviceRegistrationResponseResult,
 )
+from wolk_gateway_module.model.device_template import DeviceTemplate
 from wolk_gateway_module.model.message import Message
 from wolk_gateway_module.protocol.registration_protocol import (
     RegistrationProtocol,
 )
 
+_RESULTS_BY_VALUE = {
+    result.value: result for result in DeviceRegistrationResponseResult
+}
+
 
 class JsonRegistrationProtocol(RegistrationProtocol):
     """Send device registration requests and handle their responses."""
@@ -39,6 +46,12 @@ class JsonRegistrationProtocol(RegistrationProtocol):
     DEVICE_REGISTRATION_RESPONSE_TOPIC_ROOT = (
         "p2d/register_subdevice_response/"
     )
+    _REQUEST_KEY_PREFIX = (
+        DEVICE_REGISTRATION_REQUEST_TOPIC_ROOT + DEVICE_PATH_PREFIX
+    )
+    _RESPONSE_KEY_PREFIX = (
+        DEVICE_REGISTRATION_RESPONSE_TOPIC_ROOT + DEVICE_PATH_PREFIX
+    )
 
     def __init__(self) -> None:
         """Create object."""
@@ -63,12 +76,10 @@ class JsonRegistrationProtocol(RegistrationProtocol):
         :returns: inbound_topics
         :rtype: list
         """
-        inbound_topics = [
-            self.DEVICE_REGISTRATION_RESPONSE_TOPIC_ROOT
-            + self.DEVICE_PATH_PREFIX
-            + device_key
-        ]
-        self.log.debug(f"Inbound topics for {device_key} : {inbound_topics}")
+        inbound_topics = [self._RESPONSE_KEY_PREFIX + device_key]
+        self.log.debug(
+            "Inbound topics for %s : %s", device_key, inbound_topics
+        )
 
         return inbound_topics
 
@@ -82,8 +93,12 @@ class JsonRegistrationProtocol(RegistrationProtocol):
         :returns: device_key
         :rtype: str
         """
-        device_key = message.topic.split("/")[-1]
-        self.log.debug(f"Made {device_key} from {message}")
+        topic = message.topic
+        if topic.startswith(self._RESPONSE_KEY_PREFIX):
+            device_key = topic[len(self._RESPONSE_KEY_PREFIX) :]
+        else:
+            device_key = topic.rpartition("/")[2]
+        self.log.debug("Made %s from %s", device_key, message)
 
         return device_key
 
@@ -101,8 +116,9 @@ class JsonRegistrationProtocol(RegistrationProtocol):
             self.DEVICE_REGISTRATION_RESPONSE_TOPIC_ROOT
         )
         self.log.debug(
-            f"Is {message} device registration response "
-            f"message: {is_device_registration_response}"
+            "Is %s device registration response message: %s",
+            message,
+            is_device_registration_response,
         )
 
         return is_device_registration_response
@@ -113,66 +129,55 @@ class JsonRegistrationProtocol(RegistrationProtocol):
         """
         Make message from device registration request.
 
+        The payload is UTF-8 encoded ``bytes`` that are published as is.
+
         :param request: Device registration request
         :type request: DeviceRegistrationRequest
 
         :returns: message
         :rtype: Message
         """
-        request_dict = {
-            "name": request.name,
-            "deviceKey": request.key,
-            "defaultBinding": request.default_binding,
-            "typeParameters": request.template.type_parameters,
-            "connectivityParameters": request.template.connectivity_parameters,
-        }
-
-        if request.template.supports_firmware_update:
-            request_dict["firmwareUpdateType"] = "DFU"
-        else:
-            request_dict["firmwareUpdateType"] = ""
-
-        request_dict["sensors"] = [
-            sensor.to_dto() for sensor in request.template.sensors
-        ]
-
-        request_dict["actuators"] = [
-            actuator.to_dto() for actuator in request.template.actuators
-        ]
-
-        request_dict["alarms"] = [
-            alarm.to_dto() for alarm in request.template.alarms
-        ]
-
-        request_dict["configurations"] = [
-            configuration.to_dto()
-            for configuration in request.template.configurations
-        ]
-
-        if (
-            "supportsFirmwareUpdate"
-            not in request.template.firmware_update_parameters
-        ):
-            request.template.firmware_update_parameters[
-                "supportsFirmwareUpdate"
-            ] = request.template.supports_firmware_update
-
-        request_dict[
-            "firmwareUpdateParameters"
-        ] = request.template.firmware_update_parameters
-
-        message = Message(
-            self.DEVICE_REGISTRATION_REQUEST_TOPIC_ROOT
-            + self.DEVICE_PATH_PREFIX
-            + request.key,
-            json.dumps(request_dict, ensure_ascii=False)
-            .encode("utf-8")
-            .decode("utf-8"),
+        payload = dumps_bytes(
+            {
+                "name": request.name,
+                "deviceKey": request.key,
+                "defaultBinding": request.default_binding,
+                **self._make_template_dict(request.template),
+            }
         )
-        self.log.debug(f"Made {message} from {request}")
+
+        message = Message(self._REQUEST_KEY_PREFIX + request.key, payload)
+        self.log.debug("Made %s from %s", message, request)
 
         return message
 
+    @staticmethod
+    def _make_template_dict(template: DeviceTemplate) -> Dict:
+        firmware_update_parameters = template.firmware_update_parameters
+        if "supportsFirmwareUpdate" not in firmware_update_parameters:
+            firmware_update_parameters = {
+                **firmware_update_parameters,
+                "supportsFirmwareUpdate": template.supports_firmware_update,
+            }
+
+        return {
+            "typeParameters": template.type_parameters,
+            "connectivityParameters": template.connectivity_parameters,
+            "firmwareUpdateType": (
+                "DFU" if template.supports_firmware_update else ""
+            ),
+            "sensors": [sensor.to_dto() for sensor in template.sensors],
+            "actuators": [
+                actuator.to_dto() for actuator in template.actuators
+            ],
+            "alarms": [alarm.to_dto() for alarm in template.alarms],
+            "configurations": [
+                configuration.to_dto()
+                for configuration in template.configurations
+            ],
+            "firmwareUpdateParameters": firmware_update_parameters,
+        }
+
     def make_registration_response(
         self, message: Message
     ) -> DeviceRegistrationResponse:
@@ -185,22 +190,19 @@ class JsonRegistrationProtocol(RegistrationProtocol):
         :returns: device_registration_response
         :rtype: DeviceRegistrationResponse
         """
-        response = json.loads(message.payload)  # type: ignore
-
-        result = DeviceRegistrationResponseResult.ERROR_UNKNOWN
+        response = loads(message.payload)  # type: ignore
 
-        for enumeration in DeviceRegistrationResponseResult:
-            if response["result"] == enumeration.value:
-                result = enumeration
-                break
-
-        description = (
-            response["description"] if "description" in response else ""
+        result = _RESULTS_BY_VALUE.get(
+            response["result"], DeviceRegistrationResponseResult.ERROR_UNKNOWN
         )
 
+        description = response.get("description", "")
+
         device_registration_response = DeviceRegistrationResponse(
             response["payload"]["deviceKey"], result, description
         )
-        self.log.debug(f"Made {device_registration_response} from {message}")
+        self.log.debug(
+            "Made %s from %s", device_registration_response, message
+        )
 
         return device_registration_response
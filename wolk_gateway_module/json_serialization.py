@@ -0,0 +1,65 @@
+"""Serialize and deserialize JSON payloads, with orjson when installed."""
+#   Copyright 2020 WolkAbout Technology s.r.o.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+import json
+from typing import Any
+from typing import Callable
+from typing import Union
+
+try:
+    import orjson
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """
+        Serialize object to compact UTF-8 encoded JSON.
+
+        :param obj: Object to serialize
+        :type obj: Any
+
+        :returns: serialized
+        :rtype: bytes
+        """
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    loads: Callable[[Union[str, bytes, bytearray]], Any] = orjson.loads
+except ImportError:  # pragma: no cover
+
+    def dumps_bytes(obj: Any) -> bytes:
+        """
+        Serialize object to compact UTF-8 encoded JSON.
+
+        :param obj: Object to serialize
+        :type obj: Any
+
+        :returns: serialized
+        :rtype: bytes
+        """
+        return json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+    loads = json.loads
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize object to compact JSON.
+
+    :param obj: Object to serialize
+    :type obj: Any
+
+    :returns: serialized
+    :rtype: str
+    """
+    return dumps_bytes(obj).decode("utf-8")
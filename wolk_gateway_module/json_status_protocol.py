@@ -12,13 +12,16 @@
 #   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
-import json
-
+from wolk_gateway_module.json_serialization import dumps
 from wolk_gateway_module.logger_factory import logger_factory
 from wolk_gateway_module.model.device_status import DeviceStatus
 from wolk_gateway_module.model.message import Message
 from wolk_gateway_module.protocol.status_protocol import StatusProtocol
 
+_STATUS_PAYLOADS = {
+    status: dumps({"state": status.value}) for status in DeviceStatus
+}
+
 
 class JsonStatusProtocol(StatusProtocol):
     """Parse inbound messages and serialize device status messages."""
@@ -28,6 +31,11 @@ class JsonStatusProtocol(StatusProtocol):
     DEVICE_STATUS_RESPONSE_TOPIC_ROOT = "d2p/subdevice_status_response/"
     DEVICE_STATUS_REQUEST_TOPIC_ROOT = "p2d/subdevice_status_request/"
     LAST_WILL_TOPIC = "lastwill"
+    _REQUEST_KEY_PREFIX = DEVICE_STATUS_REQUEST_TOPIC_ROOT + DEVICE_PATH_PREFIX
+    _RESPONSE_KEY_PREFIX = (
+        DEVICE_STATUS_RESPONSE_TOPIC_ROOT + DEVICE_PATH_PREFIX
+    )
+    _UPDATE_KEY_PREFIX = DEVICE_STATUS_UPDATE_TOPIC_ROOT + DEVICE_PATH_PREFIX
 
     def __init__(self) -> None:
         """Create object."""
@@ -52,11 +60,7 @@ class JsonStatusProtocol(StatusProtocol):
         :returns: inbound_topics
         :rtype: list
         """
-        inbound_topics = [
-            self.DEVICE_STATUS_REQUEST_TOPIC_ROOT
-            + self.DEVICE_PATH_PREFIX
-            + device_key
-        ]
+        inbound_topics = [self._REQUEST_KEY_PREFIX + device_key]
         self.log.debug(f"Inbound topics for {device_key} : {inbound_topics}")
 
         return inbound_topics
@@ -96,10 +100,8 @@ class JsonStatusProtocol(StatusProtocol):
         :rtype: Message
         """
         message = Message(
-            self.DEVICE_STATUS_RESPONSE_TOPIC_ROOT
-            + self.DEVICE_PATH_PREFIX
-            + device_key,
-            json.dumps({"state": device_status.value}),
+            self._RESPONSE_KEY_PREFIX + device_key,
+            _STATUS_PAYLOADS[device_status],
         )
         self.log.debug(f"Made {message} from {device_status} and {device_key}")
 
@@ -120,10 +122,8 @@ class JsonStatusProtocol(StatusProtocol):
         :rtype: Message
         """
         message = Message(
-            self.DEVICE_STATUS_UPDATE_TOPIC_ROOT
-            + self.DEVICE_PATH_PREFIX
-            + device_key,
-            json.dumps({"state": device_status.value}),
+            self._UPDATE_KEY_PREFIX + device_key,
+            _STATUS_PAYLOADS[device_status],
         )
         self.log.debug(f"Made {message} from {device_status} and {device_key}")
 
@@ -139,7 +139,7 @@ class JsonStatusProtocol(StatusProtocol):
         :returns: message
         :rtype: Message
         """
-        message = Message(self.LAST_WILL_TOPIC, json.dumps(device_keys))
+        message = Message(self.LAST_WILL_TOPIC, dumps(device_keys))
         self.log.debug(f"Made {message} from {device_keys}")
 
         return message
@@ -154,7 +154,7 @@ class JsonStatusProtocol(StatusProtocol):
         :returns: device_key
         :rtype: str
         """
-        device_key = message.topic.split("/")[-1]
+        device_key = message.topic.rpartition("/")[2]
         self.log.debug(f"Made {device_key} from {message}")
 
         return device_key
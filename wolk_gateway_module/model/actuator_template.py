@@ -12,6 +12,7 @@
 #   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
+from dataclasses import dataclass
 from typing import Dict
 from typing import Optional
 from typing import Union
@@ -19,6 +20,7 @@ from typing import Union
 from wolk_gateway_module.model.data_type import DataType
 
 
+@dataclass(init=False, eq=False)
 class ActuatorTemplate:
     """
     Actuator template for registering device on Platform.
@@ -33,6 +35,13 @@ class ActuatorTemplate:
     :vartype unit: dict
     """
 
+    __slots__ = ("name", "reference", "description", "unit")
+
+    name: str
+    reference: str
+    description: Optional[str]
+    unit: Dict[str, str]
+
     def __init__(
         self,
         name: str,
@@ -63,9 +72,9 @@ class ActuatorTemplate:
         :param description: Description detailing the actuator
         :type description: Optional[str]
         """
-        self.name: str = name
-        self.reference: str = reference
-        self.description: Optional[str] = description
+        self.name = name
+        self.reference = reference
+        self.description = description
 
         if not (data_type or reading_type_name or unit):
             raise ValueError("Unable to create template")
@@ -74,7 +83,7 @@ class ActuatorTemplate:
             if not isinstance(data_type, DataType):
                 raise ValueError("Invalid data type given")
             if data_type == DataType.NUMERIC:
-                self.unit: Dict[str, str] = {
+                self.unit = {
                     "readingTypeName": "COUNT(ACTUATOR)",
                     "symbol": "count",
                 }
@@ -93,19 +102,6 @@ class ActuatorTemplate:
             )
         self.unit = {"readingTypeName": reading_type_name, "symbol": unit}
 
-    def __repr__(self) -> str:
-        """
-        Make string representation of actuator template.
-
-        :returns: representation
-        :rtype: str
-        """
-        return (
-            f"ActuatorTemplate(name='{self.name}', "
-            f"reference='{self.reference}', description='{self.description}', "
-            f"unit='{self.unit}')"
-        )
-
     def to_dto(self) -> Dict[str, Union[int, float, str, Dict[str, str]]]:
         """
         Create data transfer object used for registration.
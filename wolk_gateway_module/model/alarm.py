@@ -29,6 +29,8 @@ class Alarm:
     :vartype timestamp: int or None
     """
 
+    __slots__ = ("reference", "active", "timestamp")
+
     reference: str
     active: bool
     timestamp: Optional[int]
@@ -13,12 +13,11 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 from dataclasses import dataclass
-from dataclasses import field
 from typing import Dict
 from typing import Optional
 
 
-@dataclass
+@dataclass(init=False)
 class AlarmTemplate:
     """
     Alarm template for registering device on WolkAbout IoT Platform.
@@ -31,9 +30,28 @@ class AlarmTemplate:
     :vartype description: str
     """
 
+    __slots__ = ("name", "reference", "description")
+
     name: str
     reference: str
-    description: Optional[str] = field(default="")
+    description: Optional[str]
+
+    def __init__(
+        self, name: str, reference: str, description: Optional[str] = ""
+    ) -> None:
+        """
+        Alarm template for device registration request.
+
+        :param name: Alarm name
+        :type name: str
+        :param reference: Alarm reference
+        :type reference: str
+        :param description: Alarm description
+        :type description: Optional[str]
+        """
+        self.name = name
+        self.reference = reference
+        self.description = description
 
     def to_dto(self) -> Dict[str, str]:
         """
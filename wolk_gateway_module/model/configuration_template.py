@@ -12,6 +12,7 @@
 #   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
+from dataclasses import dataclass
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -19,7 +20,10 @@ from typing import Union
 
 from wolk_gateway_module.model.data_type import DataType
 
+_DATA_TYPE_NAMES = {data_type: data_type.name for data_type in DataType}
 
+
+@dataclass(init=False, eq=False)
 class ConfigurationTemplate:
     """
     Configuration template for registering device on Platform.
@@ -40,6 +44,24 @@ class ConfigurationTemplate:
     :vartype size: int
     """
 
+    __slots__ = (
+        "name",
+        "reference",
+        "description",
+        "default_value",
+        "size",
+        "labels",
+        "data_type",
+    )
+
+    name: str
+    reference: str
+    description: Optional[str]
+    default_value: Optional[str]
+    size: int
+    labels: Optional[List[str]]
+    data_type: DataType
+
     def __init__(
         self,
         name: str,
@@ -68,16 +90,16 @@ class ConfigurationTemplate:
         :param default_value: Default configuration value
         :type default_value: Optional[str]
         """
-        self.name: str = name
-        self.reference: str = reference
-        self.description: Optional[str] = description
+        self.name = name
+        self.reference = reference
+        self.description = description
 
-        self.default_value: Optional[str] = default_value
+        self.default_value = default_value
         if size < 1 or size > 3:
             raise ValueError("Size can only be 1, 2 or 3")
         if size == 1:
-            self.size: int = 1
-            self.labels: Optional[List[str]] = None
+            self.size = 1
+            self.labels = None
         else:
             self.size = size
             if not labels:
@@ -85,23 +107,7 @@ class ConfigurationTemplate:
             self.labels = labels
         if not isinstance(data_type, DataType):
             raise ValueError("Invalid data type given")
-        self.data_type: DataType = data_type
-
-    def __repr__(self) -> str:
-        """
-        Make string representation of configuration template.
-
-        :returns: representation
-        :rtype: str
-        """
-        return (
-            f"ConfigurationTemplate(name='{self.name}', "
-            f"reference='{self.reference}', description='{self.description}', "
-            f"data_type='{self.data_type}', "
-            f"default_value='{self.default_value}', "
-            f"size='{self.size}', "
-            f"labels='{self.labels}')"
-        )
+        self.data_type = data_type
 
     def to_dto(self) -> Dict[str, Union[int, str, float, List[str]]]:
         """
@@ -113,7 +119,7 @@ class ConfigurationTemplate:
         dto: Dict[str, Union[str, int, float, List[str]]] = {
             "name": self.name,
             "reference": self.reference,
-            "dataType": self.data_type.name,
+            "dataType": _DATA_TYPE_NAMES[self.data_type],
         }
 
         if self.size != 1 and self.labels is not None:
@@ -13,9 +13,9 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 from dataclasses import dataclass
-from dataclasses import field
 from typing import Dict
 from typing import List
+from typing import Optional
 
 from wolk_gateway_module.model.actuator_template import ActuatorTemplate
 from wolk_gateway_module.model.alarm_template import AlarmTemplate
@@ -25,7 +25,7 @@ from wolk_gateway_module.model.configuration_template import (
 from wolk_gateway_module.model.sensor_template import SensorTemplate
 
 
-@dataclass
+@dataclass(init=False)
 class DeviceTemplate:
     """
     Contains information required for registering device on Platform.
@@ -58,11 +58,74 @@ class DeviceTemplate:
     :vartype firmware_update_parameters: Dict[str, Union[str, int, float, bool]]
     """
 
-    actuators: List[ActuatorTemplate] = field(default_factory=list)
-    alarms: List[AlarmTemplate] = field(default_factory=list)
-    configurations: List[ConfigurationTemplate] = field(default_factory=list)
-    sensors: List[SensorTemplate] = field(default_factory=list)
-    supports_firmware_update: bool = field(default=False)
-    type_parameters: Dict = field(default_factory=dict)
-    connectivity_parameters: Dict = field(default_factory=dict)
-    firmware_update_parameters: Dict = field(default_factory=dict)
+    __slots__ = (
+        "actuators",
+        "alarms",
+        "configurations",
+        "sensors",
+        "supports_firmware_update",
+        "type_parameters",
+        "connectivity_parameters",
+        "firmware_update_parameters",
+    )
+
+    actuators: List[ActuatorTemplate]
+    alarms: List[AlarmTemplate]
+    configurations: List[ConfigurationTemplate]
+    sensors: List[SensorTemplate]
+    supports_firmware_update: bool
+    type_parameters: Dict
+    connectivity_parameters: Dict
+    firmware_update_parameters: Dict
+
+    def __init__(
+        self,
+        actuators: Optional[List[ActuatorTemplate]] = None,
+        alarms: Optional[List[AlarmTemplate]] = None,
+        configurations: Optional[List[ConfigurationTemplate]] = None,
+        sensors: Optional[List[SensorTemplate]] = None,
+        supports_firmware_update: bool = False,
+        type_parameters: Optional[Dict] = None,
+        connectivity_parameters: Optional[Dict] = None,
+        firmware_update_parameters: Optional[Dict] = None,
+    ) -> None:
+        """
+        Device template for device registration request.
+
+        :param actuators: List of actuators on device
+        :type actuators: Optional[List[ActuatorTemplate]]
+        :param alarms: List of alarms on device
+        :type alarms: Optional[List[AlarmTemplate]]
+        :param configurations: List of configurations on device
+        :type configurations: Optional[List[ConfigurationTemplate]]
+        :param sensors: List of sensors on device
+        :type sensors: Optional[List[SensorTemplate]]
+        :param supports_firmware_update: Is firmware update enabled
+        :type supports_firmware_update: bool
+        :param type_parameters: Device's type parameters
+        :type type_parameters: Optional[Dict]
+        :param connectivity_parameters: Device's connectivity parameters
+        :type connectivity_parameters: Optional[Dict]
+        :param firmware_update_parameters: Firmware update parameters
+        :type firmware_update_parameters: Optional[Dict]
+        """
+        self.actuators = actuators if actuators is not None else []
+        self.alarms = alarms if alarms is not None else []
+        self.configurations = (
+            configurations if configurations is not None else []
+        )
+        self.sensors = sensors if sensors is not None else []
+        self.supports_firmware_update = supports_firmware_update
+        self.type_parameters = (
+            type_parameters if type_parameters is not None else {}
+        )
+        self.connectivity_parameters = (
+            connectivity_parameters
+            if connectivity_parameters is not None
+            else {}
+        )
+        self.firmware_update_parameters = (
+            firmware_update_parameters
+            if firmware_update_parameters is not None
+            else {}
+        )
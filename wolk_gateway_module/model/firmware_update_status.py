@@ -13,7 +13,6 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 from dataclasses import dataclass
-from dataclasses import field
 from enum import Enum
 from enum import unique
 from typing import Optional
@@ -64,7 +63,7 @@ class FirmwareUpdateErrorCode(Enum):
     DEVICE_NOT_PRESENT = 4
 
 
-@dataclass
+@dataclass(init=False)
 class FirmwareUpdateStatus:
     """
     Holds information about current firmware update status.
@@ -75,5 +74,23 @@ class FirmwareUpdateStatus:
     :vartype error_code: Optional[FirmwareUpdateErrorCode]
     """
 
+    __slots__ = ("status", "error_code")
+
     status: FirmwareUpdateState
-    error_code: Optional[FirmwareUpdateErrorCode] = field(default=None)
+    error_code: Optional[FirmwareUpdateErrorCode]
+
+    def __init__(
+        self,
+        status: FirmwareUpdateState,
+        error_code: Optional[FirmwareUpdateErrorCode] = None,
+    ) -> None:
+        """
+        Firmware update status with optional error code.
+
+        :param status: Firmware update status
+        :type status: FirmwareUpdateState
+        :param error_code: Description of error that occured
+        :type error_code: Optional[FirmwareUpdateErrorCode]
+        """
+        self.status = status
+        self.error_code = error_code
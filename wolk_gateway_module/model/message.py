@@ -13,12 +13,11 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 from dataclasses import dataclass
-from dataclasses import field
 from typing import Optional
 from typing import Union
 
 
-@dataclass
+@dataclass(init=False)
 class Message:
     """
     MQTT message identified by topic and payload.
@@ -29,5 +28,23 @@ class Message:
     :vartype payload: bytes or str or bytearray or None
     """
 
+    __slots__ = ("topic", "payload")
+
     topic: str
-    payload: Optional[Union[str, bytes, bytearray]] = field(default=None)
+    payload: Optional[Union[str, bytes, bytearray]]
+
+    def __init__(
+        self,
+        topic: str,
+        payload: Optional[Union[str, bytes, bytearray]] = None,
+    ) -> None:
+        """
+        Create message for topic with optional payload.
+
+        :param topic: Topic where the message is from or will be sent to
+        :type topic: str
+        :param payload: Content of the message
+        :type payload: Optional[Union[str, bytes, bytearray]]
+        """
+        self.topic = topic
+        self.payload = payload
@@ -41,6 +41,8 @@ class ReadingType:
     :vartype unit: Union[ReadingTypeMeasurementUnit, str]
     """
 
+    __slots__ = ("name", "unit")
+
     def __init__(
         self,
         data_type: Optional[DataType] = None,
@@ -13,13 +13,25 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 from dataclasses import dataclass
-from dataclasses import field
 from typing import Optional
 from typing import Tuple
 from typing import Union
 
+ReadingValue = Union[
+    bool,
+    int,
+    float,
+    str,
+    Tuple[int, int],
+    Tuple[int, int, int],
+    Tuple[float, float],
+    Tuple[float, float, float],
+    Tuple[str, str],
+    Tuple[str, str, str],
+]
 
-@dataclass
+
+@dataclass(init=False)
 class SensorReading:
     """
     Holds information about a sensor reading.
@@ -32,17 +44,28 @@ class SensorReading:
     :vartype timestamp: Optional[int]
     """
 
+    __slots__ = ("reference", "value", "timestamp")
+
     reference: str
-    value: Union[
-        bool,
-        int,
-        float,
-        str,
-        Tuple[int, int],
-        Tuple[int, int, int],
-        Tuple[float, float],
-        Tuple[float, float, float],
-        Tuple[str, str],
-        Tuple[str, str, str],
-    ]
-    timestamp: Optional[int] = field(default=None)
+    value: ReadingValue
+    timestamp: Optional[int]
+
+    def __init__(
+        self,
+        reference: str,
+        value: ReadingValue,
+        timestamp: Optional[int] = None,
+    ) -> None:
+        """
+        Create sensor reading.
+
+        :param reference: Device sensor's reference as defined in device template
+        :type reference: str
+        :param value: Data that the sensor reading yielded
+        :type value: ReadingValue
+        :param timestamp: Unix timestamp in miliseconds
+        :type timestamp: Optional[int]
+        """
+        self.reference = reference
+        self.value = value
+        self.timestamp = timestamp
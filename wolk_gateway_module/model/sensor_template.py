@@ -12,6 +12,7 @@
 #   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
+from dataclasses import dataclass
 from typing import Dict
 from typing import Optional
 from typing import Union
@@ -23,7 +24,13 @@ from wolk_gateway_module.model.reading_type_measurement_unit import (
 )
 from wolk_gateway_module.model.reading_type_name import ReadingTypeName as Name
 
+# Serialized values of reading type enumerations, looked up by member
+# instead of going through the enum value descriptor on every to_dto call
+_NAME_VALUES: Dict[Union[Name, str], str] = {name: name.value for name in Name}
+_UNIT_VALUES: Dict[Union[Unit, str], str] = {unit: unit.value for unit in Unit}
 
+
+@dataclass(init=False, eq=False)
 class SensorTemplate:
     """
     Sensor template for registering device on Platform.
@@ -38,6 +45,13 @@ class SensorTemplate:
     :vartype unit: ReadingType
     """
 
+    __slots__ = ("name", "reference", "description", "unit")
+
+    name: str
+    reference: str
+    description: Optional[str]
+    unit: ReadingType
+
     def __init__(
         self,
         name: str,
@@ -85,35 +99,15 @@ class SensorTemplate:
         if data_type:
             if not isinstance(data_type, DataType):
                 raise ValueError("Invalid data type given")
-            if data_type == DataType.NUMERIC:
-                self.unit = ReadingType(DataType.NUMERIC)
-            elif data_type == DataType.BOOLEAN:
-                self.unit = ReadingType(DataType.BOOLEAN)
-            elif data_type == DataType.STRING:
-                self.unit = ReadingType(DataType.STRING)
+            self.unit = ReadingType(data_type)
             return
 
-        if not (
-            reading_type_name
-            and (isinstance(unit, str) or isinstance(unit, Unit))
-        ):
+        if not (reading_type_name and isinstance(unit, (str, Unit))):
             raise ValueError(
                 "Both reading type name and unit must be provided"
             )
         self.unit = ReadingType(name=reading_type_name, unit=unit)
 
-    def __repr__(self) -> str:
-        """
-        Make string representation of sensor template.
-
-        :returns: representation
-        :rtype: str
-        """
-        return (
-            f"SensorTemplate(name='{self.name}', reference='{self.reference}',"
-            f" description='{self.description}', unit='{self.unit}')"
-        )
-
     def to_dto(self) -> Dict[str, Union[str, int, float, Dict[str, str]]]:
         """
         Create data transfer object used for registration.
@@ -128,19 +122,10 @@ class SensorTemplate:
 
         dto["description"] = self.description if self.description else ""
 
-        dto["unit"] = (
-            {
-                "readingTypeName": self.unit.name.value,
-                "symbol": self.unit.unit.value,
-            }
-            if (
-                isinstance(self.unit.name, Name)
-                and isinstance(self.unit.unit, Unit)
-            )
-            else {
-                "readingTypeName": str(self.unit.name),
-                "symbol": str(self.unit.unit),
-            }
-        )
+        unit = self.unit
+        dto["unit"] = {
+            "readingTypeName": str(_NAME_VALUES.get(unit.name, unit.name)),
+            "symbol": str(_UNIT_VALUES.get(unit.unit, unit.unit)),
+        }
 
         return dto
@@ -12,10 +12,14 @@
 #   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
+from collections import deque
+from threading import Event
 from threading import Lock
+from threading import Thread
+from time import monotonic
 from time import sleep
-from time import time
 from typing import Callable
+from typing import Dict
 from typing import List
 from typing import Optional
 
@@ -27,10 +31,20 @@ from wolk_gateway_module.connectivity.connectivity_service import (
 from wolk_gateway_module.logger_factory import logger_factory
 from wolk_gateway_module.model.message import Message
 
+_CONNACK_ERRORS: Dict[Optional[int], str] = {
+    1: "Connection refused - incorrect protocol version",
+    2: "Connection refused - invalid client identifier",
+    3: "Connection refused - server unavailable",
+    4: "Connection refused - bad username or password",
+    5: "Connection refused - not authorized",
+}
+
 
 class MQTTConnectivityService(ConnectivityService):
     """Responsible for exchanging data with WolkGateway through MQTT."""
 
+    FLUSH_TIMEOUT = 5
+
     def __repr__(self) -> str:
         """
         Make string representation of MQTTConnectivityService.
@@ -46,6 +60,7 @@ class MQTTConnectivityService(ConnectivityService):
             f"qos='{self.qos}', "
             f"lastwill_message='{self.lastwill_message}', "
             f"inbound_message_listener='{self.inbound_message_listener}', "
+            f"publish_in_background='{self.publish_in_background}', "
             f"connected='{self._connected}')"
         )
 
@@ -57,6 +72,7 @@ class MQTTConnectivityService(ConnectivityService):
         qos: int,
         lastwill_message: Message,
         topics: list,
+        publish_in_background: bool = False,
     ) -> None:
         """
         Prepare MQTT connectivity service for connecting to WolkGateway.
@@ -73,6 +89,9 @@ class MQTTConnectivityService(ConnectivityService):
         :type lastwill_message: Message
         :param topics: List of topics to subscribe to
         :type topics: list
+        :param publish_in_background: Hand messages to a background thread
+            instead of publishing them on the calling thread
+        :type publish_in_background: bool
         """
         self.log = logger_factory.get_logger(str(self.__class__.__name__))
 
@@ -87,6 +106,7 @@ class MQTTConnectivityService(ConnectivityService):
         ] = lambda message: print("\n\nNo inbound message listener set!\n\n")
         self._connected = False
         self.connected_rc: Optional[int] = None
+        self._connack_received = Event()
 
         self.client = mqtt.Client(client_id=self.client_id)
         self.client.on_connect = self._on_mqtt_connect
@@ -99,6 +119,12 @@ class MQTTConnectivityService(ConnectivityService):
 
         self.mutex = Lock()
 
+        self.publish_in_background = publish_in_background
+        self._pending: deque = deque()
+        self._pending_event = Event()
+        self._stop_publishing = Event()
+        self._publisher: Optional[Thread] = None
+
         self.log.debug(self.__repr__())
 
     def set_inbound_message_listener(
@@ -174,63 +200,30 @@ class MQTTConnectivityService(ConnectivityService):
 
         self.mutex.acquire()
 
+        self._connack_received.clear()
         self.client.connect(self.host, self.port)
         self.client.loop_start()
 
         self.log.info(f"Connecting to {self.host}:{self.port} ...")
 
-        timeout = round(time()) + 5
-
-        while True:
-
-            if round(time()) > timeout:
-                self.log.warning("Connection timed out!")
-                self.mutex.release()
-                return False
-
-            if self._connected is not True:
-                sleep(0.1)
-                continue
-
-            if self.connected_rc == 0:
-                break
-
-            elif self.connected_rc == 1:
-                self.log.error(
-                    "Connection refused - incorrect protocol version"
-                )
-                self.mutex.release()
-                return False
-
-            elif self.connected_rc == 2:
-                self.log.error(
-                    "Connection refused - invalid client identifier"
-                )
-                self.mutex.release()
-                return False
-
-            elif self.connected_rc == 3:
-                self.log.error("Connection refused - server unavailable")
-                self.mutex.release()
-                return False
-
-            elif self.connected_rc == 4:
-                self.log.error("Connection refused - bad username or password")
-                self.mutex.release()
-                return False
-
-            elif self.connected_rc == 5:
-                self.log.error("Connection refused - not authorized")
-                self.mutex.release()
-                return False
+        if not self._connack_received.wait(5):
+            self.log.warning("Connection timed out!")
+            self.mutex.release()
+            return False
 
-        self.log.debug(f"Subscribing to topics: {self.topics}")
-        for topic in self.topics:
-            self.client.subscribe(topic, 2)
+        if self.connected_rc != 0:
+            self.log.error(
+                _CONNACK_ERRORS.get(self.connected_rc, "Connection refused")
+            )
+            self.mutex.release()
+            return False
 
         self.mutex.release()
         self._connected = True
 
+        if self.publish_in_background:
+            self._start_publisher()
+
         return True
 
     def reconnect(self) -> bool:
@@ -252,37 +245,163 @@ class MQTTConnectivityService(ConnectivityService):
     def disconnect(self) -> None:
         """Terminate connection with WolkGateway."""
         self.log.debug(f"Disconnecting from {self.host} : {self.port}")
+        self._stop_publisher()
         if self._connected:
+            if not self._flush_pending(self.FLUSH_TIMEOUT):
+                self.log.warning(
+                    "Keeping %s queued messages that were not published",
+                    len(self._pending),
+                )
             self.client.publish(
                 self.lastwill_message.topic, self.lastwill_message.payload
             )
-            self.client.loop_stop()
+            # Disconnect before stopping the network loop so the packets
+            # queued above are written out ahead of DISCONNECT
             self.client.disconnect()
+            self.client.loop_stop()
 
     def publish(self, message: Message) -> bool:
         """
         Publish serialized data to WolkGateway.
 
+        When publishing in background the message is only queued for the
+        publisher thread, so the result is always True.
+
         :param message: Message to be published
         :type message: Message
         :returns: result
         :rtype: bool
         """
+        if self.publish_in_background:
+            self._pending.append(message)
+            self._pending_event.set()
+            return True
+
         if not self._connected:
             self.log.warning(f"Not connected, unable to publish {message}")
             return False
 
-        self.mutex.acquire()
-
-        info = self.client.publish(message.topic, message.payload, self.qos)
+        with self.mutex:
+            info = self.client.publish(
+                message.topic, message.payload, self.qos
+            )
 
         if info.rc == mqtt.MQTT_ERR_SUCCESS:
-            self.log.debug(f"Published {message}")
-            self.mutex.release()
+            self.log.debug("Published %s", message)
             return True
-        else:
-            self.mutex.release()
-            return info.is_published()
+        if self.qos == 0:
+            # Nothing is kept for retransmission at QoS 0
+            return False
+        return info.is_published()
+
+    def publish_many(self, messages: List[Message]) -> int:
+        """
+        Publish serialized data to WolkGateway in order.
+
+        Messages are handed to the MQTT client while holding the lock once
+        for the whole batch. Stops at the first message that could not
+        be published.
+
+        :param messages: Messages to be published
+        :type messages: List[Message]
+        :returns: number of messages published from the start of the list
+        :rtype: int
+        """
+        if self.publish_in_background:
+            self._pending.extend(messages)
+            self._pending_event.set()
+            return len(messages)
+
+        if not self._connected:
+            self.log.warning(
+                "Not connected, unable to publish %s messages", len(messages)
+            )
+            return 0
+
+        published = 0
+        publish = self.client.publish
+        qos = self.qos
+        with self.mutex:
+            for message in messages:
+                info = publish(message.topic, message.payload, qos)
+                if info.rc != mqtt.MQTT_ERR_SUCCESS:
+                    break
+                published += 1
+
+        self.log.debug("Published %s of %s messages", published, len(messages))
+        return published
+
+    def _start_publisher(self) -> None:
+        """Start the thread publishing queued messages if not running."""
+        if self._publisher is not None and self._publisher.is_alive():
+            return
+        self._stop_publishing.clear()
+        self._publisher = Thread(
+            target=self._run_publisher,
+            name=f"{self.client_id}-publisher",
+            daemon=True,
+        )
+        self._publisher.start()
+
+    def _stop_publisher(self) -> None:
+        """Stop the thread publishing queued messages if running."""
+        if self._publisher is None:
+            return
+        self._stop_publishing.set()
+        self._pending_event.set()
+        self._publisher.join(timeout=5)
+        self._publisher = None
+
+    def _flush_pending(self, timeout: float) -> bool:
+        """
+        Publish queued messages on the calling thread.
+
+        Retries until the queue is empty, the connection is lost or the
+        timeout expires. Messages that were not published stay queued.
+
+        :param timeout: Seconds to keep retrying
+        :type timeout: float
+
+        :returns: all queued messages were published
+        :rtype: bool
+        """
+        deadline = monotonic() + timeout
+        while self._pending and self._connected:
+            self._drain_pending()
+            if not self._pending or monotonic() >= deadline:
+                break
+            sleep(0.1)
+        return not self._pending
+
+    def _run_publisher(self) -> None:
+        """Publish queued messages whenever new ones are added."""
+        while not self._stop_publishing.is_set():
+            self._pending_event.wait()
+            self._pending_event.clear()
+            self._drain_pending()
+
+    def _drain_pending(self) -> int:
+        """
+        Publish queued messages in order until the queue is empty.
+
+        A message that could not be published is put back at the front
+        of the queue and draining stops until the next attempt.
+
+        :returns: number of messages published
+        :rtype: int
+        """
+        published = 0
+        while self._pending and self._connected:
+            message = self._pending.popleft()
+            with self.mutex:
+                info = self.client.publish(
+                    message.topic, message.payload, self.qos
+                )
+            if info.rc != mqtt.MQTT_ERR_SUCCESS:
+                self._pending.appendleft(message)
+                break
+            published += 1
+        return published
 
     def _on_mqtt_message(
         self, client: mqtt.Client, userdata: str, message: mqtt.MQTTMessage
@@ -316,26 +435,23 @@ class MQTTConnectivityService(ConnectivityService):
         :type rc: int
         """
         self.log.debug(f"CONNACK: {rc}")
+        self.connected_rc = rc
         if rc == 0:  # Connection successful
-            self.connected_rc = 0
             self._connected = True
+        # Wake up connect() before taking the lock it holds while waiting
+        self._connack_received.set()
+
+        if rc == 0:
             # Subscribing in on_mqtt_connect() means if we lose the connection
             # and reconnect then subscriptions will be renewed.
             if self.topics:
-                self.mutex.acquire()
-                for topic in self.topics:
-                    self.client.subscribe(topic, 2)
-                self.mutex.release()
-        elif rc == 1:  # Connection refused - incorrect protocol version
-            self.connected_rc = 1
-        elif rc == 2:  # Connection refused - invalid client identifier
-            self.connected_rc = 2
-        elif rc == 3:  # Connection refused - server unavailable
-            self.connected_rc = 3
-        elif rc == 4:  # Connection refused - bad username or password
-            self.connected_rc = 4
-        elif rc == 5:  # Connection refused - not authorized
-            self.connected_rc = 5
+                self.log.debug(f"Subscribing to topics: {self.topics}")
+                with self.mutex:
+                    self.client.subscribe(
+                        [(topic, 2) for topic in self.topics]
+                    )
+            # Flush messages queued while there was no connection.
+            self._pending_event.set()
 
     def _on_mqtt_disconnect(
         self, client: mqtt.Client, userdata: str, rc: int
@@ -13,6 +13,7 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 from collections import deque
+from itertools import islice
 from typing import List
 from typing import Optional
 
@@ -59,7 +60,7 @@ class OutboundMessageDeque(OutboundMessageQueue):
         :returns: result
         :rtype: bool
         """
-        self.log.debug(f"Placing in storage: {message}")
+        self.log.debug("Placing in storage: %s", message)
         self.queue.append(message)
         return True
 
@@ -70,10 +71,11 @@ class OutboundMessageDeque(OutboundMessageQueue):
         :returns: result
         :rtype: bool
         """
-        self.log.debug(f"Removing from storage: {message}")
-        if message in self.queue:
+        self.log.debug("Removing from storage: %s", message)
+        try:
             self.queue.remove(message)
-            return True
+        except ValueError:
+            pass
         return True
 
     def get_messages_for_device(self, device_key: str) -> List[Message]:
@@ -110,9 +112,23 @@ class OutboundMessageDeque(OutboundMessageQueue):
             message = self.queue[0]
         except IndexError:
             message = None
-        self.log.debug(f"Got message from storage: {message}")
+        self.log.debug("Got message from storage: %s", message)
         return message
 
+    def get_batch(self, count: int) -> List[Message]:
+        """
+        Get up to ``count`` first messages from storage without removing them.
+
+        :param count: Maximum number of messages to return
+        :type count: int
+
+        :returns: messages
+        :rtype: List[Message]
+        """
+        messages = list(islice(self.queue, count))
+        self.log.debug("Got %s messages from storage", len(messages))
+        return messages
+
     def queue_size(self) -> int:
         """
         Return current number of messages in storage.
@@ -121,5 +137,5 @@ class OutboundMessageDeque(OutboundMessageQueue):
         :rtype: int
         """
         size = len(self.queue)
-        self.log.debug(f"Queue size: {size}")
+        self.log.debug("Queue size: %s", size)
         return size
@@ -46,6 +46,22 @@ class OutboundMessageQueue(ABC):
         """
         pass
 
+    def get_batch(self, count: int) -> List[Message]:
+        """
+        Get up to ``count`` first messages from storage without removing them.
+
+        Implementations may override this to return more than the first
+        message, so stored messages can be published as a batch.
+
+        :param count: Maximum number of messages to return
+        :type count: int
+
+        :returns: messages
+        :rtype: List[Message]
+        """
+        message = self.get()
+        return [] if message is None else [message]
+
     @abstractmethod
     def remove(self, message: Message) -> bool:
         """
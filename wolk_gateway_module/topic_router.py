@@ -0,0 +1,101 @@
+"""Classify inbound message topics by their leading topic levels."""
+#   Copyright 2020 WolkAbout Technology s.r.o.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+from wolk_gateway_module.json_data_protocol import JsonDataProtocol
+from wolk_gateway_module.json_firmware_update_protocol import (
+    JsonFirmwareUpdateProtocol,
+)
+from wolk_gateway_module.json_registration_protocol import (
+    JsonRegistrationProtocol,
+)
+from wolk_gateway_module.json_status_protocol import JsonStatusProtocol
+
+
+class TopicRouter:
+    """
+    Match a topic against many prefixes with a single dictionary lookup.
+
+    Every prefix is a sequence of whole topic levels ending with the level
+    delimiter, so the kind of a topic is found by splitting off its
+    leading levels once and looking them up.
+    """
+
+    def __init__(self, prefixes: Dict[str, str]) -> None:
+        """
+        Index prefixes by their topic levels.
+
+        :param prefixes: Topic prefix for each message kind
+        :type prefixes: Dict[str, str]
+
+        :raises ValueError: Prefix does not end with a topic level delimiter
+        """
+        self.kinds: Dict[Tuple[str, ...], str] = {}
+        for kind, prefix in prefixes.items():
+            if not prefix.endswith("/"):
+                raise ValueError(f"Prefix '{prefix}' must end with '/'")
+            self.kinds[tuple(prefix[:-1].split("/"))] = kind
+        self.depths = sorted({len(levels) for levels in self.kinds})
+        self.max_depth = self.depths[-1] if self.depths else 0
+
+    def __repr__(self) -> str:
+        """
+        Make string representation of TopicRouter.
+
+        :returns: representation
+        :rtype: str
+        """
+        return f"TopicRouter(kinds={self.kinds!r})"
+
+    def route(self, topic: str) -> Optional[str]:
+        """
+        Return the kind of message received on topic.
+
+        :param topic: Topic of inbound message
+        :type topic: str
+
+        :returns: kind
+        :rtype: Optional[str]
+        """
+        levels = topic.split("/", self.max_depth)
+        for depth in self.depths:
+            if len(levels) <= depth:
+                break
+            kind = self.kinds.get(tuple(levels[:depth]))
+            if kind is not None:
+                return kind
+        return None
+
+
+JSON_INBOUND_TOPIC_PREFIXES = {
+    "actuator_set": JsonDataProtocol.ACTUATOR_SET,
+    "actuator_get": JsonDataProtocol.ACTUATOR_GET,
+    "configuration_set": JsonDataProtocol.CONFIGURATION_SET,
+    "configuration_get": JsonDataProtocol.CONFIGURATION_GET,
+    "registration_response": (
+        JsonRegistrationProtocol.DEVICE_REGISTRATION_RESPONSE_TOPIC_ROOT
+    ),
+    "device_status_request": (
+        JsonStatusProtocol.DEVICE_STATUS_REQUEST_TOPIC_ROOT
+    ),
+    "firmware_install": (
+        JsonFirmwareUpdateProtocol.FIRMWARE_UPDATE_INSTALL_TOPIC_ROOT
+    ),
+    "firmware_abort": (
+        JsonFirmwareUpdateProtocol.FIRMWARE_UPDATE_ABORT_TOPIC_ROOT
+    ),
+}
@@ -67,6 +67,8 @@ from wolk_gateway_module.protocol.registration_protocol import (
     RegistrationProtocol,
 )
 from wolk_gateway_module.protocol.status_protocol import StatusProtocol
+from wolk_gateway_module.topic_router import JSON_INBOUND_TOPIC_PREFIXES
+from wolk_gateway_module.topic_router import TopicRouter
 
 Configuration = Dict[
     str,
@@ -84,6 +86,9 @@ Configuration = Dict[
     ],
 ]
 
+_JSON_TOPIC_ROUTER = TopicRouter(JSON_INBOUND_TOPIC_PREFIXES)
+_PUBLISH_BATCH_SIZE = 100
+
 
 class Wolk:
     """
@@ -347,7 +352,30 @@ class Wolk:
         else:
             self.outbound_message_queue = OutboundMessageDeque()
 
+        self._topic_router: Optional[TopicRouter] = None
+        if (
+            type(self.data_protocol) is JsonDataProtocol
+            and type(self.firmware_update_protocol)
+            is JsonFirmwareUpdateProtocol
+            and type(self.status_protocol) is JsonStatusProtocol
+            and type(self.registration_protocol) is JsonRegistrationProtocol
+        ):
+            self._topic_router = _JSON_TOPIC_ROUTER
+        self._inbound_message_handlers: Dict[
+            str, Callable[[Message], None]
+        ] = {
+            "actuator_set": self._on_actuator_set_message,
+            "actuator_get": self._on_actuator_get_message,
+            "configuration_set": self._on_configuration_set_message,
+            "configuration_get": self._on_configuration_get_message,
+            "registration_response": self._on_registration_response_message,
+            "device_status_request": self._on_device_status_request_message,
+            "firmware_install": self._on_firmware_install_command,
+            "firmware_abort": self._on_firmware_abort_command,
+        }
+
         self.devices: List[Device] = []
+        self._devices_by_key: Dict[str, Device] = {}
 
         last_will_message = self.status_protocol.make_last_will_message(
             [device.key for device in self.devices]
@@ -478,152 +506,169 @@ class Wolk:
         """
         self.log.debug(f"Received message: {message}")
 
-        if self.data_protocol.is_actuator_set_message(message):
+        if self._topic_router is not None:
+            message_kind = self._topic_router.route(message.topic)
+            if message_kind is not None:
+                self._inbound_message_handlers[message_kind](message)
+            return
 
-            if not (self.actuation_handler and self.actuator_status_provider):
-                self.log.warning(
-                    f"Received actuation message {message} , but no "
-                    "actuation handler and actuator status provider present"
-                )
+        for is_message_kind, handle_message in (
+            (
+                self.data_protocol.is_actuator_set_message,
+                self._on_actuator_set_message,
+            ),
+            (
+                self.data_protocol.is_actuator_get_message,
+                self._on_actuator_get_message,
+            ),
+            (
+                self.data_protocol.is_configuration_set_message,
+                self._on_configuration_set_message,
+            ),
+            (
+                self.data_protocol.is_configuration_get_message,
+                self._on_configuration_get_message,
+            ),
+            (
+                self.registration_protocol.is_registration_response_message,
+                self._on_registration_response_message,
+            ),
+            (
+                self.status_protocol.is_device_status_request_message,
+                self._on_device_status_request_message,
+            ),
+            (
+                self.firmware_update_protocol.is_firmware_install_command,
+                self._on_firmware_install_command,
+            ),
+            (
+                self.firmware_update_protocol.is_firmware_abort_command,
+                self._on_firmware_abort_command,
+            ),
+        ):
+            if is_message_kind(message):
+                handle_message(message)
                 return
 
-            self.log.info(f"Received actuator set command: {message}")
-            device_key = self.data_protocol.extract_key_from_message(message)
-            device_status = self.device_status_provider(device_key)
-            if device_status not in [
-                DeviceStatus.CONNECTED,
-                DeviceStatus.SLEEP,
-            ]:
-                self.log.warning(
-                    f"Device '{device_key}' returned '{device_status.value}' "
-                    "status, not forwarding command"
-                )
-                self.publish_device_status(device_key)
-                return
+    def _on_actuator_set_message(self, message: Message) -> None:
+        """
+        Handle actuator set command.
 
-            actuator_command_set = self.data_protocol.make_actuator_command(
-                message
-            )
-            self.actuation_handler(
-                device_key,
-                actuator_command_set.reference,
-                actuator_command_set.value,  # type: ignore
+        :param message: Message received
+        :type message: Message
+        """
+        if not (self.actuation_handler and self.actuator_status_provider):
+            self.log.warning(
+                f"Received actuation message {message} , but no "
+                "actuation handler and actuator status provider present"
             )
-            try:
-                self.publish_actuator_status(
-                    device_key, actuator_command_set.reference
-                )
-                return
-            except RuntimeError as e:
-                self.log.error(
-                    "Error occurred during handing"
-                    f" inbound actuation message {message} : {e}"
-                )
-
-        elif self.data_protocol.is_actuator_get_message(message):
-
-            if not (self.actuation_handler and self.actuator_status_provider):
-                self.log.warning(
-                    f"Received actuation message {message} , but no "
-                    "actuation handler and actuator status provider present"
-                )
-                return
+            return
 
-            self.log.info(f"Received actuator get command: {message}")
-            device_key = self.data_protocol.extract_key_from_message(message)
-            device_status = self.device_status_provider(device_key)
-            if device_status not in [
-                DeviceStatus.CONNECTED,
-                DeviceStatus.SLEEP,
-            ]:
-                self.log.warning(
-                    f"Device '{device_key}' returned '{device_status.value}' "
-                    "status, not forwarding command"
-                )
-                self.publish_device_status(device_key)
-                return
+        self.log.info(f"Received actuator set command: {message}")
+        device_key = self.data_protocol.extract_key_from_message(message)
+        device_status = self.device_status_provider(device_key)
+        if device_status not in [
+            DeviceStatus.CONNECTED,
+            DeviceStatus.SLEEP,
+        ]:
+            self.log.warning(
+                f"Device '{device_key}' returned '{device_status.value}' "
+                "status, not forwarding command"
+            )
+            self.publish_device_status(device_key)
+            return
 
-            actuator_command_get = self.data_protocol.make_actuator_command(
-                message
+        actuator_command_set = self.data_protocol.make_actuator_command(
+            message
+        )
+        self.actuation_handler(
+            device_key,
+            actuator_command_set.reference,
+            actuator_command_set.value,  # type: ignore
+        )
+        try:
+            self.publish_actuator_status(
+                device_key, actuator_command_set.reference
+            )
+            return
+        except RuntimeError as e:
+            self.log.error(
+                "Error occurred during handing"
+                f" inbound actuation message {message} : {e}"
             )
-            try:
-                self.publish_actuator_status(
-                    device_key, actuator_command_get.reference
-                )
-            except RuntimeError as e:
-                self.log.error(
-                    "Error occurred during handing "
-                    f"inbound actuation message {message} : {e}"
-                )
 
-        elif self.data_protocol.is_configuration_set_message(message):
+    def _on_actuator_get_message(self, message: Message) -> None:
+        """
+        Handle actuator get command.
 
-            if not (
-                self.configuration_handler and self.configuration_provider
-            ):
-                self.log.warning(
-                    f"Received configuration message {message} , but no "
-                    "configuration handler and configuration provider present"
-                )
-                return
+        :param message: Message received
+        :type message: Message
+        """
+        if not (self.actuation_handler and self.actuator_status_provider):
+            self.log.warning(
+                f"Received actuation message {message} , but no "
+                "actuation handler and actuator status provider present"
+            )
+            return
 
-            self.log.info(f"Received configuration set command: {message}")
-            device_key = self.data_protocol.extract_key_from_message(message)
-            device_status = self.device_status_provider(device_key)
-            if device_status not in [
-                DeviceStatus.CONNECTED,
-                DeviceStatus.SLEEP,
-            ]:
-                self.log.warning(
-                    f"Device '{device_key}' returned '{device_status.value}' "
-                    "status, not forwarding command"
-                )
-                self.publish_device_status(device_key)
-                return
+        self.log.info(f"Received actuator get command: {message}")
+        device_key = self.data_protocol.extract_key_from_message(message)
+        device_status = self.device_status_provider(device_key)
+        if device_status not in [
+            DeviceStatus.CONNECTED,
+            DeviceStatus.SLEEP,
+        ]:
+            self.log.warning(
+                f"Device '{device_key}' returned '{device_status.value}' "
+                "status, not forwarding command"
+            )
+            self.publish_device_status(device_key)
+            return
 
-            config_set = self.data_protocol.make_configuration_command(message)
-            if config_set.value is not None:
-                self.configuration_handler(device_key, config_set.value)
-                try:
-                    self.publish_configuration(device_key)
-                except RuntimeError as e:
-                    self.log.error(
-                        "Error occurred during handling "
-                        f"inbound configuration message {message} : {e}"
-                    )
-                    return
-            else:
-                self.log.warning(
-                    "Received malformed configuration message: "
-                    f"{message}\nParser yielded: {config_set}"
-                )
-                return
+        actuator_command_get = self.data_protocol.make_actuator_command(
+            message
+        )
+        try:
+            self.publish_actuator_status(
+                device_key, actuator_command_get.reference
+            )
+        except RuntimeError as e:
+            self.log.error(
+                "Error occurred during handing "
+                f"inbound actuation message {message} : {e}"
+            )
 
-        elif self.data_protocol.is_configuration_get_message(message):
+    def _on_configuration_set_message(self, message: Message) -> None:
+        """
+        Handle configuration set command.
 
-            if not (
-                self.configuration_handler and self.configuration_provider
-            ):
-                self.log.warning(
-                    f"Received configuration message {message} , but no "
-                    "configuration handler and configuration provider present"
-                )
-                return
+        :param message: Message received
+        :type message: Message
+        """
+        if not (self.configuration_handler and self.configuration_provider):
+            self.log.warning(
+                f"Received configuration message {message} , but no "
+                "configuration handler and configuration provider present"
+            )
+            return
 
-            self.log.info(f"Received configuration get command: {message}")
-            device_key = self.data_protocol.extract_key_from_message(message)
-            device_status = self.device_status_provider(device_key)
-            if device_status not in [
-                DeviceStatus.CONNECTED,
-                DeviceStatus.SLEEP,
-            ]:
-                self.log.warning(
-                    f"Device '{device_key}' returned '{device_status.value}' "
-                    "status, not forwarding command"
-                )
-                self.publish_device_status(device_key)
-                return
+        self.log.info(f"Received configuration set command: {message}")
+        device_key = self.data_protocol.extract_key_from_message(message)
+        device_status = self.device_status_provider(device_key)
+        if device_status not in [
+            DeviceStatus.CONNECTED,
+            DeviceStatus.SLEEP,
+        ]:
+            self.log.warning(
+                f"Device '{device_key}' returned '{device_status.value}' "
+                "status, not forwarding command"
+            )
+            self.publish_device_status(device_key)
+            return
 
+        config_set = self.data_protocol.make_configuration_command(message)
+        if config_set.value is not None:
+            self.configuration_handler(device_key, config_set.value)
             try:
                 self.publish_configuration(device_key)
             except RuntimeError as e:
@@ -632,168 +677,217 @@ class Wolk:
                     f"inbound configuration message {message} : {e}"
                 )
                 return
+        else:
+            self.log.warning(
+                "Received malformed configuration message: "
+                f"{message}\nParser yielded: {config_set}"
+            )
+            return
 
-        elif self.registration_protocol.is_registration_response_message(
-            message
-        ):
+    def _on_configuration_get_message(self, message: Message) -> None:
+        """
+        Handle configuration get command.
 
-            response = self.registration_protocol.make_registration_response(
-                message
+        :param message: Message received
+        :type message: Message
+        """
+        if not (self.configuration_handler and self.configuration_provider):
+            self.log.warning(
+                f"Received configuration message {message} , but no "
+                "configuration handler and configuration provider present"
             )
-            if response.key not in [device.key for device in self.devices]:
-                self.log.warning(
-                    f"Received unexpected registration response: {message}"
-                )
-                return
+            return
 
-            self.log.info(f"Received registration response: {response}")
+        self.log.info(f"Received configuration get command: {message}")
+        device_key = self.data_protocol.extract_key_from_message(message)
+        device_status = self.device_status_provider(device_key)
+        if device_status not in [
+            DeviceStatus.CONNECTED,
+            DeviceStatus.SLEEP,
+        ]:
+            self.log.warning(
+                f"Device '{device_key}' returned '{device_status.value}' "
+                "status, not forwarding command"
+            )
+            self.publish_device_status(device_key)
+            return
 
-            for device in self.devices:
-                if device.key == response.key:
-                    registered_device = device
-                    break
-
-            device_status = self.device_status_provider(registered_device.key)
-            if device_status not in [
-                DeviceStatus.CONNECTED,
-                DeviceStatus.SLEEP,
-            ]:
-                self.log.warning(
-                    f"Device '{registered_device.key}' returned "
-                    f"'{device_status.value}' "
-                    "status, not getting device data"
-                )
-                self.publish_device_status(device_key)
-                return
+        try:
+            self.publish_configuration(device_key)
+        except RuntimeError as e:
+            self.log.error(
+                "Error occurred during handling "
+                f"inbound configuration message {message} : {e}"
+            )
+            return
 
-            if registered_device.get_actuator_references():
-                for reference in registered_device.get_actuator_references():
-                    try:
-                        self.publish_actuator_status(
-                            registered_device.key, reference
-                        )
-                    except RuntimeError as e:
-                        self.log.error(
-                            "Error occurred when sending actuator status "
-                            f"for device {registered_device.key} with "
-                            f"reference {reference} : {e}"
-                        )
+    def _on_registration_response_message(self, message: Message) -> None:
+        """
+        Handle device registration response.
 
-            if registered_device.has_configurations():
+        :param message: Message received
+        :type message: Message
+        """
+        response = self.registration_protocol.make_registration_response(
+            message
+        )
+        registered_device = self._devices_by_key.get(response.key)
+        if registered_device is None:
+            self.log.warning(
+                f"Received unexpected registration response: {message}"
+            )
+            return
+
+        self.log.info(f"Received registration response: {response}")
+
+        device_status = self.device_status_provider(registered_device.key)
+        if device_status not in [
+            DeviceStatus.CONNECTED,
+            DeviceStatus.SLEEP,
+        ]:
+            self.log.warning(
+                f"Device '{registered_device.key}' returned "
+                f"'{device_status.value}' "
+                "status, not getting device data"
+            )
+            self.publish_device_status(registered_device.key)
+            return
+
+        if registered_device.get_actuator_references():
+            for reference in registered_device.get_actuator_references():
                 try:
-                    self.publish_configuration(registered_device.key)
+                    self.publish_actuator_status(
+                        registered_device.key, reference
+                    )
                 except RuntimeError as e:
                     self.log.error(
-                        "Error occurred when sending configuration "
-                        f"for device {registered_device.key} : {e}"
+                        "Error occurred when sending actuator status "
+                        f"for device {registered_device.key} with "
+                        f"reference {reference} : {e}"
                     )
 
-            if registered_device.supports_firmware_update():
-                if self.firmware_handler is not None:
-                    version = self.firmware_handler.get_firmware_version(
-                        registered_device.key
+        if registered_device.has_configurations():
+            try:
+                self.publish_configuration(registered_device.key)
+            except RuntimeError as e:
+                self.log.error(
+                    "Error occurred when sending configuration "
+                    f"for device {registered_device.key} : {e}"
+                )
+
+        if registered_device.supports_firmware_update():
+            if self.firmware_handler is not None:
+                version = self.firmware_handler.get_firmware_version(
+                    registered_device.key
+                )
+                if not version:
+                    self.log.error(
+                        "Did not get firmware version for "
+                        f"device '{registered_device.key}'"
                     )
-                    if not version:
+                    return
+
+                msg = self.firmware_update_protocol.make_version_message(
+                    registered_device.key, version
+                )
+                if not self.connectivity_service.publish(msg):
+                    if not self.outbound_message_queue.put(msg):
                         self.log.error(
-                            "Did not get firmware version for "
-                            f"device '{registered_device.key}'"
+                            "Failed to publish or store "
+                            f"firmware version message {msg}"
                         )
                         return
 
-                    msg = self.firmware_update_protocol.make_version_message(
-                        registered_device.key, version
-                    )
-                    if not self.connectivity_service.publish(msg):
-                        if not self.outbound_message_queue.put(msg):
-                            self.log.error(
-                                "Failed to publish or store "
-                                f"firmware version message {msg}"
-                            )
-                            return
-
-        elif self.status_protocol.is_device_status_request_message(message):
+    def _on_device_status_request_message(self, message: Message) -> None:
+        """
+        Handle device status request.
 
-            self.log.info(f"Received device status request: {message}")
-            device_key = self.status_protocol.extract_key_from_message(message)
-            status = self.device_status_provider(device_key)
-            if not status:
+        :param message: Message received
+        :type message: Message
+        """
+        self.log.info(f"Received device status request: {message}")
+        device_key = self.status_protocol.extract_key_from_message(message)
+        status = self.device_status_provider(device_key)
+        if not status:
+            self.log.error(
+                "Device status provider didn't return a "
+                f"status for device '{device_key}'"
+            )
+            return
+        message = self.status_protocol.make_device_status_response_message(
+            status, device_key
+        )
+        if not self.connectivity_service.publish(message):
+            if not self.outbound_message_queue.put(message):
                 self.log.error(
-                    "Device status provider didn't return a "
-                    f"status for device '{device_key}'"
+                    "Failed to publish or store "
+                    f"device status message {message}"
                 )
-                return
-            message = self.status_protocol.make_device_status_response_message(
-                status, device_key
-            )
-            if not self.connectivity_service.publish(message):
-                if not self.outbound_message_queue.put(message):
-                    self.log.error(
-                        "Failed to publish or store "
-                        f"device status message {message}"
-                    )
-
-        elif self.firmware_update_protocol.is_firmware_install_command(
-            message
-        ):
 
-            if self.firmware_handler is None:
-                self.log.warning(
-                    "No firmware handler, ignoring message: " f"{message}"
-                )
-                return
+    def _on_firmware_install_command(self, message: Message) -> None:
+        """
+        Handle firmware install command.
 
-            key = self.firmware_update_protocol.extract_key_from_message(
-                message
+        :param message: Message received
+        :type message: Message
+        """
+        if self.firmware_handler is None:
+            self.log.warning(
+                "No firmware handler, ignoring message: " f"{message}"
             )
-            device_status = self.device_status_provider(key)
-            if device_status not in [
-                DeviceStatus.CONNECTED,
-                DeviceStatus.SLEEP,
-            ]:
-                self.log.warning(
-                    f"Device '{key}' returned '{device_status.value}' "
-                    "status, not forwarding command"
-                )
-                self.publish_device_status(key)
-                return
+            return
 
-            path = self.firmware_update_protocol.make_firmware_file_path(
-                message
-            )
-            self.log.info(
-                "Received firmware installation command "
-                f"for device '{key}' with file path: {path}"
-            )
-            firmware_status = FirmwareUpdateStatus(
-                FirmwareUpdateState.INSTALLATION
-            )
-            update_message = self.firmware_update_protocol.make_update_message(
-                key, firmware_status
+        key = self.firmware_update_protocol.extract_key_from_message(message)
+        device_status = self.device_status_provider(key)
+        if device_status not in [
+            DeviceStatus.CONNECTED,
+            DeviceStatus.SLEEP,
+        ]:
+            self.log.warning(
+                f"Device '{key}' returned '{device_status.value}' "
+                "status, not forwarding command"
             )
-            if not self.connectivity_service.publish(update_message):
-                if not self.outbound_message_queue.put(update_message):
-                    self.log.error(
-                        "Failed to publish or store "
-                        f"firmware update status message {update_message}"
-                    )
+            self.publish_device_status(key)
+            return
 
-            self.firmware_handler.install_firmware(key, path)
+        path = self.firmware_update_protocol.make_firmware_file_path(message)
+        self.log.info(
+            "Received firmware installation command "
+            f"for device '{key}' with file path: {path}"
+        )
+        firmware_status = FirmwareUpdateStatus(
+            FirmwareUpdateState.INSTALLATION
+        )
+        update_message = self.firmware_update_protocol.make_update_message(
+            key, firmware_status
+        )
+        if not self.connectivity_service.publish(update_message):
+            if not self.outbound_message_queue.put(update_message):
+                self.log.error(
+                    "Failed to publish or store "
+                    f"firmware update status message {update_message}"
+                )
 
-        elif self.firmware_update_protocol.is_firmware_abort_command(message):
+        self.firmware_handler.install_firmware(key, path)
 
-            if self.firmware_handler is None:
-                self.log.warning(
-                    "No firmware handler, ignoring message: " f"{message}"
-                )
-                return
+    def _on_firmware_abort_command(self, message: Message) -> None:
+        """
+        Handle firmware abort command.
 
-            key = self.firmware_update_protocol.extract_key_from_message(
-                message
-            )
-            self.log.info(
-                "Received firmware installation abort command for device {key}"
+        :param message: Message received
+        :type message: Message
+        """
+        if self.firmware_handler is None:
+            self.log.warning(
+                "No firmware handler, ignoring message: " f"{message}"
             )
-            self.firmware_handler.abort_installation(key)
+            return
+
+        key = self.firmware_update_protocol.extract_key_from_message(message)
+        self.log.info(
+            "Received firmware installation abort command for device {key}"
+        )
+        self.firmware_handler.abort_installation(key)
 
     def add_sensor_reading(
         self,
@@ -1139,8 +1233,7 @@ class Wolk:
             raise ValueError(
                 "Given device is not an instance of Device class!"
             )
-        device_keys = [device.key for device in self.devices]
-        if device.key in device_keys:
+        if device.key in self._devices_by_key:
             self.log.error(f"Device with key '{device.key}' was already added")
             return
 
@@ -1174,6 +1267,7 @@ class Wolk:
                 return
 
         self.devices.append(device)
+        self._devices_by_key[device.key] = device
 
         device_topics = []
         device_topics.extend(
@@ -1234,14 +1328,12 @@ class Wolk:
         :type device_key: str
         """
         self.log.debug(f"Removing device: {device_key}")
-        if device_key not in [device.key for device in self.devices]:
+        device = self._devices_by_key.pop(device_key, None)
+        if device is None:
             self.log.info(f"Device with key '{device_key}' was not stored")
             return
 
-        for device in self.devices:
-            if device_key == device.key:
-                self.devices.remove(device)
-                break
+        self.devices.remove(device)
 
         self.connectivity_service.remove_topics_for_device(device_key)
 
@@ -1281,18 +1373,14 @@ class Wolk:
             return
 
         if device_key is None:
-            while self.outbound_message_queue.queue_size() > 0:
-                message = self.outbound_message_queue.get()
-                if message is None:
+            while True:
+                messages = self.outbound_message_queue.get_batch(
+                    _PUBLISH_BATCH_SIZE
+                )
+                if not messages:
+                    return
+                if self._publish_messages(messages) < len(messages):
                     return
-                if not self.connectivity_service.publish(message):
-                    self.log.error(f"Failed to publish {message}")
-                    sleep(0.2)
-                    self.log.info(f"Retrying publish {message}")
-                    if not self.connectivity_service.publish(message):
-                        self.log.error(f"Failed to publish {message}")
-                        return
-                self.outbound_message_queue.remove(message)
         else:
             messages = self.outbound_message_queue.get_messages_for_device(
                 device_key
@@ -1300,15 +1388,40 @@ class Wolk:
             if len(messages) == 0:
                 self.log.warning(f"No messages stored for {device_key}")
                 return
-            for message in messages:
-                if not self.connectivity_service.publish(message):
-                    self.log.error(f"Failed to publish {message}")
-                    sleep(0.2)
-                    self.log.info(f"Retrying publish {message}")
-                    if not self.connectivity_service.publish(message):
-                        self.log.error(f"Failed to publish {message}")
-                        return
+            self._publish_messages(messages)
+
+    def _publish_messages(self, messages: List[Message]) -> int:
+        """
+        Publish messages in order and remove them from storage.
+
+        A message that fails to publish is retried once, publishing stops
+        if the retry fails as well.
+
+        :param messages: Messages to publish
+        :type messages: List[Message]
+
+        :returns: Number of messages published
+        :rtype: int
+        """
+        sent = 0
+        while sent < len(messages):
+            remaining = messages[sent:]
+            published = self.connectivity_service.publish_many(remaining)
+            for message in remaining[:published]:
                 self.outbound_message_queue.remove(message)
+            sent += published
+            if sent == len(messages):
+                break
+            message = messages[sent]
+            self.log.error(f"Failed to publish {message}")
+            sleep(0.2)
+            self.log.info(f"Retrying publish {message}")
+            if not self.connectivity_service.publish(message):
+                self.log.error(f"Failed to publish {message}")
+                break
+            self.outbound_message_queue.remove(message)
+            sent += 1
+        return sent
 
     def connect(self) -> None:
         """